@@ -0,0 +1,77 @@
+"""
+Benchmark AdversarialHost throughput.
+
+Plays games against the adversarial host with a cheap solver (first
+remaining candidate after trim_list) and prints games per second, both with
+feedback computed in batch and with pattern matrix rows for the openers in
+a SharedWordTable. The host rate counts only the time spent in respond(),
+the game rate includes the solver.
+
+Usage:
+    python -m benchmarks.bench_adversarial_host [num_games] [num_words]
+
+num_words defaults to the full word list.
+"""
+
+import random
+import sys
+import time
+
+from src.game_hosts import AdversarialHost
+from src.game_logic import retrieve_word_list, trim_list
+from src.shared_words import SharedWordTable, build_pattern_matrix
+
+NUM_OPENERS = 20
+
+
+def play(host, words, opener, max_turns=20):
+    host.new_game()
+    candidates = words
+    guess = opener
+    host_time = 0.0
+    for turn in range(max_turns):
+        start = time.perf_counter()
+        feedback = host.respond(guess)
+        host_time += time.perf_counter() - start
+        if host.solution is not None:
+            return turn + 1, host_time
+        candidates = trim_list(guess, feedback, candidates, backend="regex")
+        guess = candidates[0]
+    return max_turns, host_time
+
+
+def bench(host, words, openers):
+    start = time.perf_counter()
+    results = [play(host, words, opener) for opener in openers]
+    elapsed = time.perf_counter() - start
+    host_time = sum(seconds for _, seconds in results)
+    mean_turns = sum(turns for turns, _ in results) / len(results)
+    return len(openers) / elapsed, len(openers) / host_time, mean_turns
+
+
+def report(label, rates):
+    game_rate, host_rate, mean_turns = rates
+    print(
+        f"{label}: {host_rate:8.1f} games/s host only, "
+        f"{game_rate:8.1f} games/s with solver, {mean_turns:.2f} turns"
+    )
+
+
+def main(num_games=1000, num_words=None, seed=0):
+    words = retrieve_word_list()[:num_words]
+    rng = random.Random(seed)
+    openers = [rng.choice(words[:NUM_OPENERS]) for _ in range(num_games)]
+    print(f"{num_games} games on {len(words)} words")
+
+    report("  batch", bench(AdversarialHost(words), words, openers))
+
+    start = time.perf_counter()
+    patterns = build_pattern_matrix(words, rows=NUM_OPENERS)
+    print(f"opener pattern rows built in {time.perf_counter() - start:.2f}s")
+    with SharedWordTable.create(words, patterns) as table:
+        report(" shared", bench(AdversarialHost(table), words, openers))
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
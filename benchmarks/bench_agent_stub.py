@@ -0,0 +1,62 @@
+"""
+Load-test the full agent pipeline against the offline stub backend.
+
+Plays games with wordle_agent() using StubBackend (optionally through the
+local HTTP stand-in and the OpenAI client) and prints turns per second.
+With WORDLE_HOST=adversarial one AdversarialHost is built and reused by
+every game, so its opening partitions are computed once.
+
+Usage:
+    python -m benchmarks.bench_agent_stub [num_games] [http]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+from src.game_hosts import HOST_ADVERSARIAL, AdversarialHost
+from src.game_logic import retrieve_word_list
+from src.llm_backends import OpenAIBackend, StubBackend, serve_stub
+from src.wordle_agent import wordle_agent
+
+
+def main(num_games=200, http=False):
+    stub = StubBackend(malformed_rate=0.2, rate_limit_rate=0.05)
+    server = None
+    backend = stub
+    if http:
+        from openai import OpenAI
+
+        server = serve_stub(stub)
+        client = OpenAI(api_key="stub", base_url=server.base_url, max_retries=0)
+        backend = OpenAIBackend(client=client)
+
+    words = retrieve_word_list()
+    host = None
+    if os.getenv("WORDLE_HOST") == HOST_ADVERSARIAL:
+        host = AdversarialHost(words)
+    output = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        for _ in range(num_games):
+            wordle_agent(host=host, backend=backend, words=words)
+    elapsed = time.perf_counter() - start
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+
+    turns = output.getvalue().count("GUESS:  ")
+    print(
+        f"{num_games} games, {turns} turns, {stub.calls} completions in "
+        f"{elapsed:.2f}s: {turns / elapsed:.0f} turns/s, "
+        f"{stub.calls / elapsed:.0f} completions/s"
+    )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+        len(sys.argv) > 2 and sys.argv[2] == "http",
+    )
@@ -0,0 +1,44 @@
+"""
+Benchmark the trim_list filter backends on the full word list.
+
+Runs the same random (guess, solution) pairs through each backend against
+the whole dictionary, checks that both backends agree and prints the mean
+time per call.
+
+Usage:
+    python -m benchmarks.bench_trim_list [num_pairs]
+"""
+
+import random
+import sys
+import time
+
+from src.game_logic import get_feedback, retrieve_word_list, trim_list
+
+BACKENDS = ["python", "regex"]
+
+
+def bench(num_pairs=200, seed=0):
+    words = retrieve_word_list()
+    rng = random.Random(seed)
+    pairs = [(rng.choice(words), rng.choice(words)) for _ in range(num_pairs)]
+    feedbacks = [get_feedback(guess, solution) for guess, solution in pairs]
+
+    results = {}
+    for backend in BACKENDS:
+        start = time.perf_counter()
+        results[backend] = [
+            trim_list(guess, feedback, words, backend=backend)
+            for (guess, _), feedback in zip(pairs, feedbacks)
+        ]
+        elapsed = time.perf_counter() - start
+        print(
+            f"{backend:>7}: {elapsed / num_pairs * 1000:.3f} ms per call "
+            f"over {len(words)} words"
+        )
+    if results["python"] != results["regex"]:
+        raise AssertionError("Backends disagree on filtered candidates.")
+
+
+if __name__ == "__main__":
+    bench(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,114 @@
+from collections import Counter
+import random
+import time
+
+from src.game_logic import feedback_code
+
+
+def bucket_score(codes):
+    """
+    Score a guess from the feedback codes it gets against a set of words.
+
+    Args:
+        codes (Sequence[int]): One feedback code per word, for example the
+                               bytes from batch_feedback_codes().
+
+    Returns:
+        float: Expected fraction of the words left after the guess (the sum
+               of squared feedback bucket sizes over the squared word
+               count). Lower is better.
+    """
+    buckets = Counter(codes)
+    return sum(size * size for size in buckets.values()) / len(codes) ** 2
+
+
+def sampled_score(guess, solutions):
+    """
+    Estimate how well a guess splits the candidate set.
+
+    Args:
+        guess (str): The guess to score.
+        solutions (list[str]): Sample of candidate solutions.
+
+    Returns:
+        float: Expected fraction of the sample left after the guess (the sum
+               of squared feedback bucket sizes over the squared sample
+               size). Lower is better.
+    """
+    return bucket_score([feedback_code(guess, solution) for solution in solutions])
+
+
+def select_guess(
+    candidates,
+    deadline_ms,
+    guesses=None,
+    rng=None,
+    initial_sample=16,
+    max_contenders=128,
+):
+    """
+    Pick the best guess found before a deadline.
+
+    Runs successive halving: a bounded random set of contenders is scored
+    against a random sample of candidates, the better half is kept and
+    rescored against a sample twice as large, and so on until one contender
+    is left or the sample covers every candidate. Within a round the
+    contenders that scored best so far are refined first, so when time runs
+    out mid-round the answer comes from the most refined contenders.
+
+    Sampling never touches the whole candidate list, so the time spent is
+    bounded by the deadline and max_contenders rather than the dictionary
+    size.
+
+    Args:
+        candidates (list[str]): Candidates left after trim_list().
+        deadline_ms (float): Time budget in milliseconds.
+        guesses (list[str], optional): Words allowed as guesses. Defaults to
+                                       candidates.
+        rng (random.Random, optional): Random source. Defaults to the
+                                       random module.
+        initial_sample (int, optional): Sample size of the first round.
+                                        Defaults to 16.
+        max_contenders (int, optional): Number of guesses considered.
+                                        Defaults to 128.
+
+    Returns:
+        tuple[str | None, float]: The best guess found and its confidence,
+            the fraction of candidates its score was measured against (1.0
+            means the score is exact, 0.0 that no round finished). The guess
+            is None only when candidates is empty.
+
+    Example:
+        >>> select_guess(["crane", "crate", "trace"], deadline_ms=50)
+        ('crane', 1.0)
+    """
+    deadline = time.perf_counter() + deadline_ms / 1000
+    if rng is None:
+        rng = random
+    if not candidates:
+        return None, 0.0
+    if len(candidates) <= 2:
+        return candidates[0], 1.0
+    if guesses is None:
+        guesses = candidates
+
+    contenders = rng.sample(guesses, min(max_contenders, len(guesses)))
+    best, confidence = contenders[0], 0.0
+    sample_size = min(initial_sample, len(candidates))
+    while True:
+        solutions = rng.sample(candidates, sample_size)
+        scores = []
+        for guess in contenders:
+            if time.perf_counter() >= deadline:
+                break
+            scores.append((sampled_score(guess, solutions), guess))
+        if scores:
+            best = min(scores)[1]
+            confidence = sample_size / len(candidates)
+        if len(scores) < len(contenders) or sample_size == len(candidates):
+            return best, confidence
+        scores.sort()
+        contenders = [guess for _, guess in scores[: max(1, len(scores) // 2)]]
+        if len(contenders) == 1:
+            return best, confidence
+        sample_size = min(sample_size * 2, len(candidates))
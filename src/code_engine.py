@@ -0,0 +1,332 @@
+from array import array
+from itertools import permutations, product
+from math import perm
+
+from src.game_logic import feedback_code
+
+SCORING_POSITIONAL = "positional"
+SCORING_COUNTS = "counts"
+
+
+class CodeSpace:
+    """
+    Every code of a given length over a symbol alphabet, generated lazily.
+
+    Codes are tuples of symbol indices (positions in the alphabet), ordered
+    lexicographically and addressed by their rank, so a space of 10^6+
+    codes costs no memory until codes are decoded. Three kinds of spaces
+    are supported:
+    - with repetition: every symbol may appear any number of times
+    - without repetition: every symbol appears at most once
+    - from a word list: only the given words, stored in one bytes buffer
+
+    Args:
+        alphabet (Sequence): The symbols, e.g. "0123456789".
+        length (int): Number of symbols per code.
+        repetition (bool, optional): Whether symbols may repeat. Defaults
+                                     to True.
+
+    Example:
+        >>> space = CodeSpace("0123456789", 4, repetition=False)
+        >>> len(space), space.symbols(space.index("1234"))
+        (5040, '1234')
+    """
+
+    def __init__(self, alphabet, length, repetition=True):
+        if not repetition and length > len(alphabet):
+            raise ValueError("Code length exceeds the alphabet size.")
+        self.alphabet = alphabet
+        self.length = length
+        self.repetition = repetition
+        self._symbol_index = {symbol: i for i, symbol in enumerate(alphabet)}
+        self._words = None
+        if repetition:
+            self._size = len(alphabet) ** length
+        else:
+            self._size = perm(len(alphabet), length)
+
+    @classmethod
+    def from_words(cls, words):
+        """
+        Build a space holding exactly the given words.
+
+        Args:
+            words (list[str]): Words of equal length.
+
+        Returns:
+            CodeSpace: The space, with codes stored as one bytes buffer of
+                       symbol indices rather than a list of strings.
+
+        Raises:
+            ValueError: If the words differ in length.
+        """
+        length = len(words[0]) if words else 0
+        if any(len(word) != length for word in words):
+            raise ValueError("All words must have the same length.")
+        space = cls("".join(sorted(set("".join(words)))), length)
+        table = space._symbol_index
+        space._words = bytes(table[symbol] for word in words for symbol in word)
+        space._size = len(words)
+        return space
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if not 0 <= index < self._size:
+            raise IndexError("code index out of range")
+        k, length = len(self.alphabet), self.length
+        if self._words is not None:
+            start = index * length
+            return tuple(self._words[start : start + length])
+        code = []
+        if self.repetition:
+            for _ in range(length):
+                index, digit = divmod(index, k)
+                code.append(digit)
+            return tuple(reversed(code))
+        available = list(range(k))
+        for pos in range(length):
+            block = perm(k - pos - 1, length - pos - 1)
+            digit, index = divmod(index, block)
+            code.append(available.pop(digit))
+        return tuple(code)
+
+    def iter_codes(self, indices=None):
+        """
+        Yield (index, code) pairs.
+
+        A full scan of a generated space runs on itertools.product or
+        permutations, which emit codes in rank order without decoding each
+        index.
+
+        Args:
+            indices (Iterable[int], optional): Ranks to visit. Defaults to
+                                               the whole space.
+        """
+        if indices is not None:
+            for index in indices:
+                yield index, self[index]
+            return
+        if self._words is not None:
+            codes = (self[index] for index in range(self._size))
+        elif self.repetition:
+            codes = product(range(len(self.alphabet)), repeat=self.length)
+        else:
+            codes = permutations(range(len(self.alphabet)), self.length)
+        yield from enumerate(codes)
+
+    def encode(self, symbols):
+        """
+        Convert symbols to a code.
+
+        Args:
+            symbols (Sequence): One alphabet symbol per position, e.g. "1234".
+
+        Returns:
+            tuple[int, ...]: The code as symbol indices.
+        """
+        return tuple(self._symbol_index[symbol] for symbol in symbols)
+
+    def symbols(self, index):
+        """
+        Convert the code at a rank back to symbols.
+
+        Returns:
+            str | tuple: A string for string alphabets, else a tuple.
+        """
+        symbols = [self.alphabet[i] for i in self[index]]
+        if isinstance(self.alphabet, str):
+            return "".join(symbols)
+        return tuple(symbols)
+
+    def index(self, symbols):
+        """
+        Rank of a code given as symbols.
+
+        Raises:
+            ValueError: If the code is not in the space.
+        """
+        code = self.encode(symbols)
+        k = len(self.alphabet)
+        if self._words is not None:
+            start = self._words.find(bytes(code))
+            while start != -1 and start % self.length:
+                start = self._words.find(bytes(code), start + 1)
+            if start == -1:
+                raise ValueError(f"{symbols!r} is not in the space.")
+            return start // self.length
+        rank = 0
+        if self.repetition:
+            for digit in code:
+                rank = rank * k + digit
+            return rank
+        if len(set(code)) != len(code):
+            raise ValueError(f"{symbols!r} repeats a symbol.")
+        available = list(range(k))
+        for pos, digit in enumerate(code):
+            block = perm(k - pos - 1, self.length - pos - 1)
+            rank += available.index(digit) * block
+            available.remove(digit)
+        return rank
+
+
+def count_feedback(guess, code):
+    """
+    Mastermind / Bulls and Cows feedback as a pair of counts.
+
+    Args:
+        guess (Sequence): The guessed code.
+        code (Sequence): The secret code.
+
+    Returns:
+        tuple[int, int]: (bulls, cows): symbols in the right position, and
+                         further symbols present but misplaced.
+
+    Example:
+        >>> count_feedback((1, 1, 2, 2), (1, 2, 1, 3))
+        (1, 2)
+    """
+    bulls = 0
+    for g, c in zip(guess, code):
+        if g == c:
+            bulls += 1
+    common = 0
+    for symbol in set(guess):
+        common += min(guess.count(symbol), code.count(symbol))
+    return bulls, common - bulls
+
+
+class FeedbackEngine:
+    """
+    Feedback and candidate filtering over a CodeSpace.
+
+    Positional scoring is Wordle's per-position 0/1/2 feedback, encoded
+    like feedback_code(). Count scoring is Mastermind's (bulls, cows).
+    Surviving candidates are kept as an array of ranks, never as a list of
+    codes or strings, so filtering a 10^6 code space only ever holds the
+    survivors' ranks in memory.
+
+    Args:
+        space (CodeSpace): The codes to play over.
+        scoring (str, optional): SCORING_POSITIONAL or SCORING_COUNTS.
+                                 Defaults to SCORING_COUNTS.
+
+    Raises:
+        ValueError: If scoring is not a known scoring rule.
+    """
+
+    def __init__(self, space, scoring=SCORING_COUNTS):
+        if scoring == SCORING_POSITIONAL:
+            self.score = feedback_code
+        elif scoring == SCORING_COUNTS:
+            self.score = count_feedback
+        else:
+            raise ValueError(f"Unknown scoring rule: {scoring}")
+        self.space = space
+        self.scoring = scoring
+
+    def feedback(self, guess, secret):
+        """
+        Feedback for a guess against a secret, both given as symbols.
+
+        Returns:
+            int | tuple[int, int]: A feedback code for positional scoring,
+                                   (bulls, cows) for count scoring.
+        """
+        return self.score(self.space.encode(guess), self.space.encode(secret))
+
+    def filter(self, guess, feedback, alive=None):
+        """
+        Keep the codes that would have produced the observed feedback.
+
+        Args:
+            guess (Sequence): The guess, as symbols.
+            feedback (int | tuple[int, int]): Feedback from feedback().
+            alive (array, optional): Ranks still possible. Defaults to the
+                                     whole space.
+
+        Returns:
+            array: Ranks of the codes consistent with the feedback.
+        """
+        guess = self.space.encode(guess)
+        space = self.space
+        if alive is None and space._words is None and self.scoring == SCORING_COUNTS:
+            return self._scan_counts(guess, feedback)
+        score = self.score
+        return array(
+            "I",
+            [
+                index
+                for index, code in self.space.iter_codes(alive)
+                if score(guess, code) == feedback
+            ],
+        )
+
+    def _scan_counts(self, guess, feedback):
+        """
+        Filter a whole generated space under count scoring.
+
+        Walks the codes as a prefix tree in rank order, carrying the bulls
+        and common-symbol counts of the prefix. A subtree is skipped in one
+        step (advancing the rank by its size) as soon as its prefix already
+        exceeds, or can no longer reach, the observed counts, so most of the
+        space is never visited.
+        """
+        target_bulls, target_cows = feedback
+        target_common = target_bulls + target_cows
+        space = self.space
+        k, length, repetition = len(space.alphabet), space.length, space.repetition
+        if repetition:
+            sizes = [k ** (length - pos - 1) for pos in range(length)]
+        else:
+            sizes = [perm(k - pos - 1, length - pos - 1) for pos in range(length)]
+        guess_counts = [guess.count(symbol) for symbol in range(k)]
+        code_counts = [0] * k
+        keep = array("I")
+        rank = 0
+
+        def visit(pos, bulls, common):
+            nonlocal rank
+            rest = length - pos - 1
+            size = sizes[pos]
+            for symbol in range(k):
+                if not repetition and code_counts[symbol]:
+                    continue
+                b = bulls + (symbol == guess[pos])
+                c = common + (code_counts[symbol] < guess_counts[symbol])
+                if (
+                    b > target_bulls
+                    or c > target_common
+                    or b + rest < target_bulls
+                    or c + rest < target_common
+                ):
+                    rank += size
+                elif rest == 0:
+                    keep.append(rank)
+                    rank += 1
+                else:
+                    code_counts[symbol] += 1
+                    visit(pos + 1, b, c)
+                    code_counts[symbol] -= 1
+
+        visit(0, 0, 0)
+        return keep
+
+
+def mastermind(colors=6, pegs=4):
+    """Classic Mastermind: colors 1-6, 4 pegs, repeats allowed."""
+    alphabet = "123456789"[:colors] if colors <= 9 else tuple(range(colors))
+    return FeedbackEngine(CodeSpace(alphabet, pegs), SCORING_COUNTS)
+
+
+def bulls_and_cows(digits=4):
+    """Bulls and Cows: a secret of distinct decimal digits."""
+    return FeedbackEngine(
+        CodeSpace("0123456789", digits, repetition=False), SCORING_COUNTS
+    )
+
+
+def wordle(words):
+    """Wordle over an explicit word list, with per-position feedback."""
+    return FeedbackEngine(CodeSpace.from_words(words), SCORING_POSITIONAL)
@@ -0,0 +1,254 @@
+from collections import Counter
+from itertools import compress
+import os
+import random
+
+from src.game_logic import (
+    batch_feedback_codes,
+    decode_feedback,
+    get_feedback,
+    word_columns,
+)
+
+HOST_FIXED = "fixed"
+HOST_ADVERSARIAL = "adversarial"
+
+# Below this many words a plain Counter beats sampling the codes first.
+_SAMPLE_MIN_WORDS = 1024
+
+
+class FixedHost:
+    """
+    Game host with a solution chosen up front.
+
+    Args:
+        solution (str): The solution word.
+    """
+
+    def __init__(self, solution):
+        self.solution = solution
+
+    def new_game(self):
+        """Start a new game; the solution stays the same."""
+
+    def respond(self, guess):
+        """
+        Return feedback for a guess against the fixed solution.
+
+        Args:
+            guess (str): The guessed word.
+
+        Returns:
+            list[int]: Feedback values (0, 1, or 2) for each position.
+        """
+        return get_feedback(list(guess), list(self.solution))
+
+
+def _largest_bucket(codes):
+    """
+    Find the most frequent feedback code, ties going to the lowest code.
+
+    Large inputs are counted one code at a time with bytes.count(), most
+    frequent first according to a small stride sample, stopping as soon as
+    the words not yet counted could no longer form a larger bucket. This
+    skips most codes when one bucket dominates, as it does for the
+    adversary.
+
+    Args:
+        codes (bytes): Feedback codes, one byte per word.
+
+    Returns:
+        int: The code of the largest bucket.
+    """
+    if len(codes) < _SAMPLE_MIN_WORDS:
+        sizes = Counter(codes)
+        return max(sizes, key=lambda code: (sizes[code], -code))
+    sample = Counter(codes[:: len(codes) // 256])
+    order = sorted(sample, key=lambda code: (-sample[code], code))
+    best, best_size = None, -1
+    uncounted = len(codes)
+    for code in order:
+        size = codes.count(code)
+        uncounted -= size
+        if size > best_size or (size == best_size and code < best):
+            best, best_size = code, size
+        if uncounted < best_size:
+            return best
+    # A code the sample missed may still be the largest.
+    for code in set(codes).difference(sample):
+        size = codes.count(code)
+        if size > best_size or (size == best_size and code < best):
+            best, best_size = code, size
+    return best
+
+
+class AdversarialHost:
+    """
+    Absurdle-style host that commits to a solution as late as possible.
+
+    Each turn the host partitions the words still alive by the feedback the
+    incoming guess would get and keeps the largest bucket, breaking ties by
+    the lowest feedback code (fewest bulls and cows). The solution is only
+    fixed once a guess lands in an all-bulls bucket.
+
+    The words still alive are kept as row indices plus one bytes column per
+    letter position, never as string copies. Each turn the feedback codes
+    for the guess are computed in one batch_feedback_codes() call (or read
+    from the pattern matrix when words is a SharedWordTable with a row for
+    the guess), the largest bucket is found by counting those bytes, and
+    the kept bucket is selected with byte masks, so no step runs Python
+    code per word. The opening partition only depends on the
+    guess, so it is cached and reused by every game hosted by the same
+    instance; call new_game() between games.
+
+    Args:
+        words (list[str] | SharedWordTable): Possible solutions, at most 5
+                                             letters long.
+    """
+
+    def __init__(self, words):
+        self.words = words
+        self._columns = word_columns(words)
+        self._pattern_rows = {}
+        self._opening = {}
+        self.new_game()
+
+    def new_game(self):
+        """Reset the host so every word is a possible solution again."""
+        self.alive = None
+        self._alive_columns = self._columns
+        self.solution = None
+
+    def remaining(self):
+        """
+        Words still consistent with every response so far.
+
+        Returns:
+            list[str]: The remaining possible solutions.
+        """
+        if self.alive is None:
+            return list(self.words)
+        return [self.words[i] for i in self.alive]
+
+    def feedback_codes(self, guess, indices, columns=None):
+        """
+        Compute feedback codes for a guess against many words at once.
+
+        Args:
+            guess (str): The guessed word.
+            indices (Sequence[int]): Rows of the words to score.
+            columns (tuple[bytes, ...], optional): word_columns() of exactly
+                those rows, if already at hand. Defaults to gathering them
+                from the full columns.
+
+        Returns:
+            bytes: One feedback code per index, as from feedback_code().
+        """
+        words = self.words
+        if getattr(words, "pattern_rows", 0):
+            if guess not in self._pattern_rows:
+                row = words.index(guess)
+                if row is not None and row < words.pattern_rows:
+                    self._pattern_rows[guess] = words.pattern_row(row)
+                else:
+                    self._pattern_rows[guess] = None
+            row = self._pattern_rows[guess]
+            if row is not None:
+                return bytes(map(row.__getitem__, indices))
+        if columns is None:
+            columns = tuple(
+                bytes(map(column.__getitem__, indices)) for column in self._columns
+            )
+        return batch_feedback_codes(guess, columns)
+
+    def partition(self, guess, indices):
+        """
+        Bucket word rows by the feedback a guess would receive.
+
+        Args:
+            guess (str): The guessed word.
+            indices (Sequence[int]): Rows of the words to partition.
+
+        Returns:
+            dict[int, list[int]]: Feedback code -> rows with that feedback.
+        """
+        buckets = {}
+        for index, code in zip(indices, self.feedback_codes(guess, indices)):
+            bucket = buckets.get(code)
+            if bucket is None:
+                buckets[code] = [index]
+            else:
+                bucket.append(index)
+        return buckets
+
+    def _worst_case(self, guess, indices, columns):
+        """Return the code, rows and columns of the bucket the adversary keeps."""
+        codes = self.feedback_codes(guess, indices, columns)
+        code = _largest_bucket(codes)
+        kept = bytearray(256)
+        kept[code] = 0xFF
+        keep = codes.translate(kept)
+        # Letters are never zero bytes, so masking the dropped words to zero
+        # and deleting the zeros compacts a column without a per-word step.
+        mask = int.from_bytes(keep, "little")
+        size = len(keep)
+        return (
+            code,
+            list(compress(indices, keep)),
+            tuple(
+                (int.from_bytes(column, "little") & mask)
+                .to_bytes(size, "little")
+                .translate(None, b"\x00")
+                for column in columns
+            ),
+        )
+
+    def respond(self, guess):
+        """
+        Return adversarial feedback for a guess and narrow the solutions.
+
+        Args:
+            guess (str): The guessed word.
+
+        Returns:
+            list[int]: Feedback values (0, 1, or 2) for each position.
+        """
+        if self.alive is None:
+            if guess not in self._opening:
+                self._opening[guess] = self._worst_case(
+                    guess, range(len(self.words)), self._columns
+                )
+            code, self.alive, self._alive_columns = self._opening[guess]
+        else:
+            code, self.alive, self._alive_columns = self._worst_case(
+                guess, self.alive, self._alive_columns
+            )
+        if code == 3 ** len(guess) - 1:
+            self.solution = guess
+        return decode_feedback(code, len(guess))
+
+
+def make_host(candidates, kind=None):
+    """
+    Create the game host for a new game.
+
+    Args:
+        candidates (list[str]): The full word list.
+        kind (str, optional): HOST_FIXED picks a random solution up front,
+                              HOST_ADVERSARIAL uses AdversarialHost.
+                              Defaults to the WORDLE_HOST environment
+                              variable, or HOST_FIXED when unset.
+
+    Returns:
+        FixedHost | AdversarialHost: The host.
+
+    Raises:
+        ValueError: If kind is not a known host.
+    """
+    if kind is None:
+        kind = os.getenv("WORDLE_HOST", HOST_FIXED)
+    if kind == HOST_FIXED:
+        return FixedHost(random.choice(candidates))
+    if kind == HOST_ADVERSARIAL:
+        return AdversarialHost(candidates)
+    raise ValueError(f"Unknown game host: {kind}")
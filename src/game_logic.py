@@ -1,8 +1,10 @@
 from collections import Counter, defaultdict
 from dotenv import load_dotenv
+from functools import lru_cache
 
 import os
 import random
+import re
 
 load_dotenv()
 
@@ -47,7 +49,8 @@ def get_feedback(guess_list, solution_list):
         solution_list (list[str]): List of characters from the solution word.
 
     Returns:
-        list[int]: Feedback list of length 5, each value being 0, 1, or 2.
+        list[int]: Feedback list with one value (0, 1, or 2) per position
+                   of the guess (5 for Wordle).
 
     Example:
         >>> get_feedback(list("CRANE"), list("CRANE"))
@@ -57,15 +60,15 @@ def get_feedback(guess_list, solution_list):
         >>> get_feedback(list("CRANE"), list("REACT"))
         [1, 1, 2, 0, 1]
     """
-    feedback = [0] * 5
+    feedback = [0] * len(guess_list)
     solution_counts = Counter(solution_list)
 
-    for letter in range(5):
+    for letter in range(len(guess_list)):
         if guess_list[letter] == solution_list[letter]:
             feedback[letter] = 2
             solution_counts[guess_list[letter]] -= 1
 
-    for letter in range(5):
+    for letter in range(len(guess_list)):
         if feedback[letter] == 0 and solution_counts[guess_list[letter]] > 0:
             feedback[letter] = 1
             solution_counts[guess_list[letter]] -= 1
@@ -73,6 +76,164 @@ def get_feedback(guess_list, solution_list):
     return feedback
 
 
+def encode_feedback(feedback):
+    """
+    Pack a feedback list into a single integer.
+
+    Each position contributes feedback[pos] * 3 ** pos, so every 5-letter
+    feedback maps to a unique code in range(243) and fits in one byte.
+
+    Args:
+        feedback (list[int]): Feedback values (0, 1, or 2) for each position.
+
+    Returns:
+        int: The packed feedback code.
+
+    Example:
+        >>> encode_feedback([0, 0, 2, 2, 2])
+        234
+    """
+    code = 0
+    for pos, value in enumerate(feedback):
+        code += value * 3**pos
+    return code
+
+
+def decode_feedback(code, length=5):
+    """
+    Unpack a code from encode_feedback() back into a feedback list.
+
+    Args:
+        code (int): The packed feedback code.
+        length (int, optional): Number of positions. Defaults to 5.
+
+    Returns:
+        list[int]: Feedback values (0, 1, or 2) for each position.
+
+    Example:
+        >>> decode_feedback(234)
+        [0, 0, 2, 2, 2]
+    """
+    feedback = []
+    for _ in range(length):
+        code, value = divmod(code, 3)
+        feedback.append(value)
+    return feedback
+
+
+def feedback_code(guess, solution):
+    """
+    Compute the packed feedback code for a guess against a solution.
+
+    Equivalent to encode_feedback(get_feedback(guess, solution)) but works
+    directly on strings without building lists or a Counter, which matters
+    when scoring every guess against every candidate.
+
+    Args:
+        guess (str): The guessed word.
+        solution (str): The solution word.
+
+    Returns:
+        int: The packed feedback code.
+
+    Example:
+        >>> feedback_code("crane", "plane")
+        234
+    """
+    code = 0
+    unmatched = []
+    for pos in range(len(guess)):
+        if guess[pos] == solution[pos]:
+            code += 2 * 3**pos
+        else:
+            unmatched.append(solution[pos])
+    if unmatched:
+        for pos in range(len(guess)):
+            letter = guess[pos]
+            if letter != solution[pos] and letter in unmatched:
+                unmatched.remove(letter)
+                code += 3**pos
+    return code
+
+
+def word_columns(words):
+    """
+    Store a word list column-wise for batch_feedback_codes().
+
+    Args:
+        words (Iterable[str]): ASCII words of equal length.
+
+    Returns:
+        tuple[bytes, ...]: One bytes object per position, holding that
+                           position's letter of every word.
+
+    Example:
+        >>> word_columns(["crane", "plane"])[0]
+        b'cp'
+    """
+    packed = "".join(words).encode("ascii")
+    if not packed:
+        return ()
+    length = len(next(iter(words)))
+    return tuple(packed[pos::length] for pos in range(length))
+
+
+def batch_feedback_codes(guess, columns):
+    """
+    Compute feedback codes for one guess against many words at once.
+
+    Gives the same codes as feedback_code(), but without a Python call per
+    word. Every column is translated once into bytes marking which of the
+    guess's letters it holds, and the rest is arithmetic on big integers in
+    which every byte holds one word's value. All loops run in C, so scoring
+    a guess against the whole dictionary costs a few passes over
+    len(words) bytes.
+
+    Args:
+        guess (str): The guessed word, at most 5 letters so that every code
+                     fits in one byte.
+        columns (tuple[bytes, ...]): Candidate words from word_columns().
+
+    Returns:
+        bytes: One feedback code per word, in column order.
+
+    Raises:
+        ValueError: If the guess is longer than 5 letters or does not match
+                    the column count.
+    """
+    length = len(guess)
+    if length > 5 or length != len(columns):
+        raise ValueError("Guess must match the columns and be at most 5 long.")
+    if not length or not columns[0]:
+        return b""
+    size = len(columns[0])
+    ones = int.from_bytes(b"\x01" * size, "little")
+    letters = guess.encode("ascii")
+    distinct = sorted(set(letters))
+    table = bytearray(256)
+    for bit, letter in enumerate(distinct):
+        table[letter] = 1 << bit
+    marks = [int.from_bytes(column.translate(table), "little") for column in columns]
+    code = 0
+    for bit, letter in enumerate(distinct):
+        # 1 in every byte whose word has this letter at the position.
+        found = [(mark >> bit) & ones for mark in marks]
+        # Cows go to the guess positions left to right while unmatched
+        # copies remain. Offset by 7, unmatched > taken is bit 3 of each
+        # byte, and the byte never goes negative or past 15.
+        unmatched = 7 * ones
+        for pos in range(length):
+            if letters[pos] != letter:
+                unmatched += found[pos]
+        for pos in range(length):
+            if letters[pos] == letter:
+                missed = ones ^ found[pos]
+                cows = (unmatched >> 3) & missed
+                code += found[pos] * (2 * 3**pos) + cows * 3**pos
+                unmatched -= missed
+    return code.to_bytes(size, "little")
+
+
 def cow_bull_absent(guess, feedback):
     """
     Categorize letters from a guess based on feedback into
@@ -150,7 +311,7 @@ def filter_candidates(candidates, filter_condition):
     ]
 
 
-def trim_list(guess, feedback, candidates):
+def trim_list(guess, feedback, candidates, backend=None):
     """
     Filter candidate words based on feedback from a guess.
 
@@ -166,6 +327,10 @@ def trim_list(guess, feedback, candidates):
         feedback (list[int]): List of feedback values (0, 1, or 2) for each
                               position, typically from get_feedback().
         candidates (list[str]): List of candidate words to filter.
+        backend (str, optional): "python" for the per-word filters below or
+                                 "regex" for trim_list_regex(). Defaults to
+                                 the FILTER_BACKEND environment variable, or
+                                 "python" when unset.
 
     Returns:
         list[str]: Filtered list of candidate words that are consistent with
@@ -177,6 +342,13 @@ def trim_list(guess, feedback, candidates):
         >>> trim_list("CRANE", feedback, candidates)
         ['PLANE']
     """
+    if backend is None:
+        backend = os.getenv("FILTER_BACKEND", "python")
+    if backend == "regex":
+        return trim_list_regex(guess, feedback, candidates)
+    if backend != "python":
+        raise ValueError(f"Unknown filter backend: {backend}")
+
     cows, bulls, absent, excluded_positions = cow_bull_absent(guess, feedback)
 
     # Filter by absent letters (letters not in the word at all)
@@ -221,6 +393,90 @@ def trim_list(guess, feedback, candidates):
     return candidates
 
 
+@lru_cache(maxsize=1024)
+def compile_constraint_pattern(length, cows, bulls, absent, excluded_positions):
+    """
+    Compile folded constraints into one multiline regular expression.
+
+    Each cow becomes a lookahead requiring the letter somewhere in the line.
+    Each position then becomes either the bull letter or a character class
+    excluding absent letters, cows seen at that position and excluded
+    positions. Patterns are cached per constraint state.
+
+    Args:
+        length (int): Word length.
+        cows (tuple[tuple[str, tuple[int, ...]], ...]): Sorted cow letters
+                                                        and positions.
+        bulls (tuple[tuple[str, tuple[int, ...]], ...]): Sorted bull letters
+                                                         and positions.
+        absent (tuple[str, ...]): Sorted absent letters.
+        excluded_positions (tuple[tuple[str, int], ...]): Sorted
+            (letter, pos) pairs that must not match.
+
+    Returns:
+        re.Pattern: Pattern matching whole lines of consistent words.
+    """
+    fixed = {}
+    banned = [set(absent) for _ in range(length)]
+    for letter, positions in bulls:
+        for pos in positions:
+            fixed[pos] = letter
+    for letter, positions in cows:
+        for pos in positions:
+            banned[pos].add(letter)
+    for letter, pos in excluded_positions:
+        banned[pos].add(letter)
+
+    parts = ["^"]
+    for letter, _ in cows:
+        parts.append(f"(?=[^\\n]*{re.escape(letter)})")
+    for pos in range(length):
+        if pos in fixed:
+            parts.append(re.escape(fixed[pos]))
+        else:
+            letters = "".join(re.escape(letter) for letter in sorted(banned[pos]))
+            parts.append(f"[^\\n{letters}]")
+    parts.append("$")
+    return re.compile("".join(parts), re.MULTILINE)
+
+
+def trim_list_regex(guess, feedback, candidates):
+    """
+    Filter candidates with a single compiled regular expression.
+
+    Alternative backend for trim_list(). The constraints from
+    cow_bull_absent() are compiled by compile_constraint_pattern() and run
+    with one re.findall() over all candidates joined into a newline
+    delimited string, so the scan happens in C rather than per-word Python.
+    Candidates are expected to have the same length as the guess.
+
+    Args:
+        guess (str): The word that was guessed.
+        feedback (list[int]): List of feedback values (0, 1, or 2) for each
+                              position, typically from get_feedback().
+        candidates (list[str]): List of candidate words to filter.
+
+    Returns:
+        list[str]: Filtered list of candidate words, in their original order.
+
+    Example:
+        >>> candidates = ["CRANE", "PLANE", "CRATE", "SLATE"]
+        >>> trim_list_regex("CRANE", [0, 0, 2, 2, 2], candidates)
+        ['PLANE']
+    """
+    if not candidates:
+        return []
+    cows, bulls, absent, excluded_positions = cow_bull_absent(guess, feedback)
+    pattern = compile_constraint_pattern(
+        len(feedback),
+        tuple(sorted((letter, tuple(pos)) for letter, pos in cows.items())),
+        tuple(sorted((letter, tuple(pos)) for letter, pos in bulls.items())),
+        tuple(sorted(absent)),
+        tuple(sorted(excluded_positions)),
+    )
+    return pattern.findall("\n".join(candidates))
+
+
 def random_word_select(candidates, num_words=20):
     """
     Select a specified number of random words from a list of candidates.
@@ -0,0 +1,192 @@
+from collections import Counter
+from itertools import chain, repeat
+import heapq
+
+
+class LetterStats:
+    """
+    Letter statistics over the current candidate set.
+
+    Tracks, for the words still in play:
+    - positional: per-position letter counts
+    - document: number of words containing each letter at least once
+
+    The statistics are built once and then updated by subtracting the words
+    each trim_list() call removed, so the counter updates cost O(removed)
+    per turn instead of a recount. Removed words are counted in bulk first,
+    so each counter gets at most one update per letter.
+
+    Args:
+        words (list[str]): The initial candidate set.
+
+    Example:
+        >>> stats = LetterStats(["crane", "plane", "slate"])
+        >>> stats.document["a"], stats.positional[0]["c"]
+        (3, 1)
+    """
+
+    def __init__(self, words):
+        self.words = set()
+        self.positional = []
+        self.document = Counter()
+        self.add(words)
+
+    def __len__(self):
+        return len(self.words)
+
+    def add(self, words):
+        """Count new words into the statistics."""
+        added = set(words).difference(self.words)
+        if not added:
+            return
+        self.words.update(added)
+        length = max(map(len, added))
+        while len(self.positional) < length:
+            self.positional.append(Counter())
+        for counts, letters in zip(self.positional, self._count_positions(added)):
+            counts.update(letters)
+        self.document.update(chain.from_iterable(map(set, added)))
+
+    def remove(self, words):
+        """
+        Subtract removed words from the statistics.
+
+        Costs O(len(words)); callers that already know which words were
+        removed can call this directly instead of sync().
+        """
+        removed = self.words.intersection(words)
+        if not removed:
+            return
+        self.words.difference_update(removed)
+        for counts, letters in zip(self.positional, self._count_positions(removed)):
+            counts.subtract(letters)
+        self.document.subtract(Counter(chain.from_iterable(map(set, removed))))
+
+    @staticmethod
+    def _count_positions(words):
+        """Count the letters at each position, one Counter per position."""
+        lengths = set(map(len, words))
+        length = max(lengths)
+        if len(lengths) == 1:
+            # Equal lengths: every position is a strided slice of one string.
+            joined = "".join(words)
+            return [Counter(joined[pos::length]) for pos in range(length)]
+        return [
+            Counter(word[pos] for word in words if len(word) > pos)
+            for pos in range(length)
+        ]
+
+    def sync(self, candidates):
+        """
+        Update the statistics to match a trimmed candidate list.
+
+        The removed words are found with one set difference, a C-level pass
+        over the tracked words and the candidates, and then subtracted with
+        remove(). Only that subtraction is O(removed).
+
+        Args:
+            candidates (list[str]): Candidates returned by trim_list().
+
+        Returns:
+            int: Number of words removed.
+        """
+        removed = self.words.difference(candidates)
+        self.remove(removed)
+        return len(removed)
+
+    def informative_letters(self, k=5):
+        """
+        Letters that best split the remaining candidates.
+
+        A letter found in every candidate (or in none) tells the solver
+        nothing, so letters are ranked by how close their document
+        frequency is to half the candidate set.
+
+        Args:
+            k (int, optional): Number of letters to return. Defaults to 5.
+
+        Returns:
+            list[str]: Up to k letters, most informative first.
+        """
+        size = len(self.words)
+        letters = [
+            letter for letter, count in self.document.items() if 0 < count < size
+        ]
+        letters.sort(key=lambda letter: (-self._split(self.document[letter]), letter))
+        return letters[:k]
+
+    def position_hints(self):
+        """
+        Most common letter at each position.
+
+        Returns:
+            list[str | None]: One letter per position, None where no
+                              candidates remain.
+        """
+        hints = []
+        for counts in self.positional:
+            present = +counts
+            hints.append(max(present, key=present.get) if present else None)
+        return hints
+
+    def score(self, word):
+        """
+        Cheap heuristic for how well a word splits the candidates.
+
+        Sums, over the word's distinct letters and over its letters by
+        position, how evenly each splits the candidate set. Higher is
+        better.
+
+        Args:
+            word (str): The word to score.
+
+        Returns:
+            int: The heuristic score.
+        """
+        return self.scorer()(word)
+
+    def scorer(self):
+        """
+        Build score() for the current statistics, for scoring many words.
+
+        Every letter's split is computed once up front, so each call is a
+        few dictionary lookups. The function is only valid until the
+        statistics next change.
+
+        Returns:
+            Callable[[str], int]: Function returning score(word).
+        """
+        document = {
+            letter: self._split(count) for letter, count in self.document.items()
+        }
+        positional = [
+            {letter: self._split(count) for letter, count in counts.items()}
+            for counts in self.positional
+        ]
+
+        zeros = repeat(0)
+
+        def score(word):
+            return sum(map(document.get, set(word), zeros)) + sum(
+                map(dict.get, positional, word, zeros)
+            )
+
+        return score
+
+    def informative_words(self, candidates, k=20):
+        """
+        The k highest scoring candidates.
+
+        Args:
+            candidates (list[str]): Words to rank.
+            k (int, optional): Number of words to return. Defaults to 20.
+
+        Returns:
+            list[str]: Up to k words, best first.
+        """
+        score = self.scorer()
+        return heapq.nsmallest(k, candidates, key=lambda word: (-score(word), word))
+
+    def _split(self, count):
+        """How evenly a count splits the candidates (0 when it does not)."""
+        return min(count, len(self.words) - count)
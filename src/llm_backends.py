@@ -0,0 +1,318 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import itertools
+import json
+import math
+import os
+import random
+import re
+import sys
+import threading
+import time
+
+LLM_BACKEND_OPENAI = "openai"
+LLM_BACKEND_STUB = "stub"
+
+# Words the prompt offers as good guesses, see build_prompt().
+_SUGGESTED_WORDS = re.compile(r"These \d+ words (.*?) are", re.DOTALL)
+_WORD = re.compile(r"\b[a-z]{5}\b")
+
+_WELL_FORMED = [
+    "AGENT GUESS: {word}",
+    "guess: '{word}'",
+    '```json\n{{"guess": "{word}"}}\n```',
+]
+_MALFORMED = [
+    "I think the answer might be {word}.",
+    "AGENT GUESS: {short}",
+    "AGENT GUESS: qqqqq",
+    "",
+]
+
+
+class BackendRateLimitError(Exception):
+    """
+    Raised by a backend when the completion was rate limited.
+
+    Args:
+        message (str): Error description.
+        retry_after (float, optional): Seconds to wait before retrying, if
+                                       the backend said so.
+    """
+
+    def __init__(self, message="Rate limited", retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _retry_after_seconds(value):
+    """
+    Parse a Retry-After header given in seconds.
+
+    Returns None when the header is missing or not a usable number of
+    seconds (for example an HTTP date), so the caller falls back to its own
+    backoff.
+    """
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return None
+    if not math.isfinite(seconds) or seconds < 0:
+        return None
+    return seconds
+
+
+class OpenAIBackend:
+    """
+    Chat completions through the OpenAI client.
+
+    Args:
+        model (str, optional): Model name. Defaults to "gpt-4o-mini".
+        client (openai.OpenAI, optional): Client to use. Defaults to one
+            built from OPENAI_API_KEY (and OPENAI_BASE_URL, which can point
+            at serve_stub() for offline runs), with the client's own retries
+            turned off so rate limits are only retried by the agent.
+    """
+
+    def __init__(self, model="gpt-4o-mini", client=None):
+        if client is None:
+            from openai import OpenAI
+
+            client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"), max_retries=0)
+        self.model = model
+        self.client = client
+
+    def complete(self, messages):
+        """
+        Return the model's reply to a list of chat messages.
+
+        Raises:
+            BackendRateLimitError: If the API rate limited the request.
+        """
+        from openai import RateLimitError
+
+        try:
+            completion = self.client.chat.completions.create(
+                model=self.model, messages=messages, temperature=0
+            )
+        except RateLimitError as error:
+            retry_after = _retry_after_seconds(
+                error.response.headers.get("retry-after")
+            )
+            raise BackendRateLimitError(str(error), retry_after) from error
+        return completion.choices[0].message.content
+
+
+class StubBackend:
+    """
+    Offline deterministic stand-in for the model, for load testing.
+
+    Answers with one of the words the prompt suggests as good guesses, in
+    one of the formats extract_guess() understands. With the configured
+    probabilities it instead raises BackendRateLimitError or returns a
+    malformed answer (no guess, a short word, a word that is not a
+    candidate, or nothing), which exercises the agent's retry path.
+    Latency is drawn from a log-normal distribution.
+
+    Args:
+        latency_ms (float, optional): Median latency in milliseconds.
+                                      Defaults to 0 (no sleep).
+        latency_sigma (float, optional): Log-normal shape; larger values
+                                         give a longer tail. Defaults to 0.5.
+        rate_limit_rate (float, optional): Probability of a rate-limit
+                                           error. Defaults to 0.
+        malformed_rate (float, optional): Probability of a malformed
+                                          answer. Defaults to 0.
+        seed (int, optional): Seed for the random source. Defaults to 0.
+    """
+
+    def __init__(
+        self,
+        latency_ms=0.0,
+        latency_sigma=0.5,
+        rate_limit_rate=0.0,
+        malformed_rate=0.0,
+        seed=0,
+    ):
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.rate_limit_rate = rate_limit_rate
+        self.malformed_rate = malformed_rate
+        self.rng = random.Random(seed)
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _words(self, messages):
+        """Words offered by the latest prompt that lists any."""
+        for message in reversed(messages):
+            content = message.get("content") or ""
+            match = _SUGGESTED_WORDS.search(content)
+            if match:
+                return _WORD.findall(match.group(1))
+        for message in reversed(messages):
+            words = _WORD.findall(message.get("content") or "")
+            if words:
+                return words
+        return ["crane"]
+
+    def complete(self, messages):
+        """
+        Return a simulated reply to a list of chat messages.
+
+        Raises:
+            BackendRateLimitError: With probability rate_limit_rate.
+        """
+        with self._lock:
+            self.calls += 1
+            roll = self.rng.random()
+            word = self.rng.choice(self._words(messages))
+            template_roll = self.rng.random()
+            delay = 0.0
+            if self.latency_ms > 0:
+                delay = self.rng.lognormvariate(
+                    math.log(self.latency_ms / 1000), self.latency_sigma
+                )
+        if delay:
+            time.sleep(delay)
+        if roll < self.rate_limit_rate:
+            raise BackendRateLimitError("Simulated rate limit", retry_after=0)
+        if roll < self.rate_limit_rate + self.malformed_rate:
+            template = _MALFORMED[int(template_roll * len(_MALFORMED))]
+        else:
+            template = _WELL_FORMED[int(template_roll * len(_WELL_FORMED))]
+        return template.format(word=word, short=word[:4])
+
+
+def get_backend(name=None):
+    """
+    Create the LLM backend for the agent.
+
+    Args:
+        name (str, optional): LLM_BACKEND_OPENAI or LLM_BACKEND_STUB.
+            Defaults to the LLM_BACKEND environment variable, or
+            LLM_BACKEND_OPENAI when unset. The stub reads STUB_LATENCY_MS,
+            STUB_RATE_LIMIT_RATE, STUB_MALFORMED_RATE and STUB_SEED.
+
+    Returns:
+        OpenAIBackend | StubBackend: The backend.
+
+    Raises:
+        ValueError: If name is not a known backend.
+    """
+    if name is None:
+        name = os.getenv("LLM_BACKEND", LLM_BACKEND_OPENAI)
+    if name == LLM_BACKEND_OPENAI:
+        return OpenAIBackend()
+    if name == LLM_BACKEND_STUB:
+        return StubBackend(
+            latency_ms=float(os.getenv("STUB_LATENCY_MS", "0")),
+            rate_limit_rate=float(os.getenv("STUB_RATE_LIMIT_RATE", "0")),
+            malformed_rate=float(os.getenv("STUB_MALFORMED_RATE", "0")),
+            seed=int(os.getenv("STUB_SEED", "0")),
+        )
+    raise ValueError(f"Unknown LLM backend: {name}")
+
+
+def _handler_for(backend):
+    """Build a request handler class serving chat completions from backend."""
+    ids = itertools.count(1)
+
+    class ChatCompletionsHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if self.path.rstrip("/") not in (
+                "/v1/chat/completions",
+                "/chat/completions",
+            ):
+                self._send(404, {"error": {"message": "Not found"}})
+                return
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                request = json.loads(self.rfile.read(length) or b"{}")
+                messages = request["messages"]
+            except (ValueError, KeyError):
+                self._send(400, {"error": {"message": "Invalid request"}})
+                return
+            try:
+                content = backend.complete(messages)
+            except BackendRateLimitError as error:
+                body = {
+                    "error": {
+                        "message": str(error),
+                        "type": "rate_limit_error",
+                        "code": "rate_limit_exceeded",
+                    }
+                }
+                self._send(429, body, {"Retry-After": str(error.retry_after or 0)})
+                return
+            self._send(
+                200,
+                {
+                    "id": f"chatcmpl-stub-{next(ids)}",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": request.get("model", "stub"),
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": content},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": {
+                        "prompt_tokens": 0,
+                        "completion_tokens": 0,
+                        "total_tokens": 0,
+                    },
+                },
+            )
+
+        def _send(self, status, body, headers=None):
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    return ChatCompletionsHandler
+
+
+def serve_stub(backend=None, host="127.0.0.1", port=0):
+    """
+    Serve a backend over a local chat-completions compatible HTTP API.
+
+    Point the OpenAI client (or OPENAI_BASE_URL) at the returned server's
+    base_url to run the full client stack offline.
+
+    Args:
+        backend (StubBackend, optional): Backend answering requests.
+                                         Defaults to StubBackend().
+        host (str, optional): Interface to bind. Defaults to "127.0.0.1".
+        port (int, optional): Port to bind, 0 for any free port.
+
+    Returns:
+        ThreadingHTTPServer: The running server, serving from a daemon
+            thread. Its base_url attribute holds the "/v1" URL; call
+            shutdown() and server_close() to stop it.
+    """
+    if backend is None:
+        backend = StubBackend()
+    server = ThreadingHTTPServer((host, port), _handler_for(backend))
+    server.daemon_threads = True
+    server.base_url = f"http://{host}:{server.server_address[1]}/v1"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
+    server = serve_stub(get_backend(LLM_BACKEND_STUB), port=port)
+    print(f"Serving stub chat completions at {server.base_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,267 @@
+from collections import defaultdict
+from functools import lru_cache
+from multiprocessing import Pool
+import hashlib
+import json
+import os
+import sys
+
+from src.anytime_select import bucket_score
+from src.game_logic import batch_feedback_codes, retrieve_word_list, word_columns
+from src.letter_stats import LetterStats
+from src.shared_words import SharedWordTable, init_worker, worker_table
+
+# word_columns() of the shared table, built once per pool worker.
+_columns = None
+
+
+def score_opener(opener, words, columns=None):
+    """
+    Score a word as the first guess.
+
+    Args:
+        opener (str): The candidate opener.
+        words (Sequence[str]): Possible solutions, at most 5 letters long.
+        columns (tuple[bytes, ...], optional): word_columns(words), if
+            already at hand. Defaults to building them.
+
+    Returns:
+        float: Expected number of solutions left after the opener (the sum
+               of squared feedback bucket sizes over the word count). Lower
+               is better.
+    """
+    if columns is None:
+        columns = word_columns(words)
+    return bucket_score(batch_feedback_codes(opener, columns)) * len(words)
+
+
+def best_second_guesses(opener, words, max_guesses=100, columns=None):
+    """
+    Find the best second guess for every feedback an opener can get.
+
+    For each feedback bucket the second guess is chosen among the bucket's
+    own words, so it can still win. Large buckets only consider their
+    max_guesses most informative words by LetterStats, each scored exactly
+    against the whole bucket.
+
+    Args:
+        opener (str): The first guess.
+        words (Sequence[str]): Possible solutions, at most 5 letters long.
+        max_guesses (int, optional): Contenders per bucket. Defaults to 100.
+        columns (tuple[bytes, ...], optional): word_columns(words), if
+            already at hand. Defaults to building them.
+
+    Returns:
+        dict[int, str]: Feedback code -> best second guess.
+    """
+    if columns is None:
+        columns = word_columns(words)
+    buckets = defaultdict(list)
+    for word, code in zip(words, batch_feedback_codes(opener, columns)):
+        buckets[code].append(word)
+    second = {}
+    for code, bucket in buckets.items():
+        if len(bucket) <= 2:
+            second[code] = bucket[0]
+            continue
+        contenders = LetterStats(bucket).informative_words(bucket, max_guesses)
+        bucket_columns = word_columns(bucket)
+        second[code] = min(
+            contenders,
+            key=lambda guess: (
+                bucket_score(batch_feedback_codes(guess, bucket_columns)),
+                guess,
+            ),
+        )
+    return second
+
+
+def _init_worker(name):
+    """Pool initializer: attach to the shared table and read its columns."""
+    global _columns
+    init_worker(name)
+    # Five bytes per word, sliced from the shared buffer; no word strings.
+    _columns = worker_table().columns()
+
+
+def _score_chunk(task):
+    """Score one chunk of openers in a pool worker."""
+    chunk_id, start, stop = task
+    table = worker_table()
+    return chunk_id, [
+        [table[i], score_opener(table[i], table, _columns)] for i in range(start, stop)
+    ]
+
+
+def _second_guess_job(opener):
+    """Compute second guesses for one opener in a pool worker."""
+    return opener, best_second_guesses(opener, worker_table(), columns=_columns)
+
+
+def _fingerprint(words):
+    """Identify a word list so checkpoints are never mixed across lists."""
+    return hashlib.sha1("\n".join(words).encode()).hexdigest()
+
+
+def _read_checkpoint(path, header):
+    """Return completed checkpoint records, or [] if stale or missing."""
+    try:
+        with open(path, "r") as file:
+            lines = file.read().splitlines()
+    except FileNotFoundError:
+        return []
+    try:
+        if not lines or json.loads(lines[0]) != header:
+            return []
+    except ValueError:
+        return []  # torn header: nothing after it can be trusted
+    records = []
+    for line in lines[1:]:
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            break  # torn last line from an interrupted run
+    return records
+
+
+def default_table_path():
+    """Opener table location, in the DATA_FOLDER next to words.txt."""
+    return f"{os.getenv('DATA_FOLDER', 'data')}/openers.json"
+
+
+def rank_openers(
+    words=None,
+    table_path=None,
+    checkpoint_path=None,
+    processes=None,
+    chunk_size=256,
+    second_guess_top=10,
+):
+    """
+    Rank every word as an opener and persist the ranked opener table.
+
+    Runs in two resumable phases on a process pool that shares the word
+    table through SharedWordTable:
+    1. Score every word as an opener, in chunks of chunk_size.
+    2. For the second_guess_top best openers, find the best second guess
+       for every feedback.
+    Each finished chunk or opener is appended to a JSON lines checkpoint,
+    so an interrupted run picks up where it stopped.
+
+    Args:
+        words (list[str], optional): Word list. Defaults to
+                                     retrieve_word_list().
+        table_path (str, optional): Output path. Defaults to
+                                    default_table_path().
+        checkpoint_path (str, optional): Checkpoint path. Defaults to
+                                         table_path + ".checkpoint".
+        processes (int, optional): Worker count. Defaults to all cores.
+        chunk_size (int, optional): Openers per task. Defaults to 256.
+        second_guess_top (int, optional): Openers that get second guesses.
+                                          Defaults to 10.
+
+    Returns:
+        dict: The table, with "openers" as [word, score] pairs best first
+              and "second_guesses" mapping opener -> feedback code (as a
+              string) -> second guess.
+    """
+    if words is None:
+        words = retrieve_word_list()
+    if table_path is None:
+        table_path = default_table_path()
+    if checkpoint_path is None:
+        checkpoint_path = f"{table_path}.checkpoint"
+    header = {"fingerprint": _fingerprint(words), "chunk_size": chunk_size}
+
+    records = _read_checkpoint(checkpoint_path, header)
+    done_chunks = {r["chunk"]: r["scores"] for r in records if "chunk" in r}
+    second_guesses = {r["opener"]: r["second"] for r in records if "opener" in r}
+    with open(checkpoint_path, "w") as file:
+        file.write(json.dumps(header) + "\n")
+        for record in records:
+            file.write(json.dumps(record) + "\n")
+
+    tasks = [
+        (chunk_id, start, min(start + chunk_size, len(words)))
+        for chunk_id, start in enumerate(range(0, len(words), chunk_size))
+        if chunk_id not in done_chunks
+    ]
+    with SharedWordTable.create(words) as table, open(
+        checkpoint_path, "a"
+    ) as checkpoint:
+        with Pool(processes, _init_worker, (table.name,)) as pool:
+            for chunk_id, scores in pool.imap_unordered(_score_chunk, tasks):
+                done_chunks[chunk_id] = scores
+                checkpoint.write(json.dumps({"chunk": chunk_id, "scores": scores}))
+                checkpoint.write("\n")
+                checkpoint.flush()
+
+            ranked = sorted(
+                (score for chunk in done_chunks.values() for score in chunk),
+                key=lambda pair: (pair[1], pair[0]),
+            )
+            top = [word for word, _ in ranked[:second_guess_top]]
+            todo = [opener for opener in top if opener not in second_guesses]
+            for opener, second in pool.imap_unordered(_second_guess_job, todo):
+                second = {str(code): guess for code, guess in second.items()}
+                second_guesses[opener] = second
+                checkpoint.write(json.dumps({"opener": opener, "second": second}))
+                checkpoint.write("\n")
+                checkpoint.flush()
+
+    result = {
+        "openers": ranked,
+        "second_guesses": {opener: second_guesses[opener] for opener in top},
+    }
+    tmp_path = f"{table_path}.tmp"
+    with open(tmp_path, "w") as file:
+        json.dump(result, file)
+    os.replace(tmp_path, table_path)
+    os.remove(checkpoint_path)
+    load_opener_table.cache_clear()
+    return result
+
+
+@lru_cache(maxsize=None)
+def load_opener_table(path=None):
+    """
+    Load the ranked opener table written by rank_openers().
+
+    The table is read once per process and cached.
+
+    Args:
+        path (str, optional): Table path. Defaults to default_table_path().
+
+    Returns:
+        dict | None: The table, or None if it has not been built.
+    """
+    if path is None:
+        path = default_table_path()
+    try:
+        with open(path, "r") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+
+def second_guess(table, opener, code):
+    """
+    Look up the precomputed second guess for an opener's feedback.
+
+    Args:
+        table (dict): Table from load_opener_table().
+        opener (str): The opener that was played.
+        code (int): Its feedback, as from encode_feedback().
+
+    Returns:
+        str | None: The second guess, or None if not precomputed.
+    """
+    return table["second_guesses"].get(opener, {}).get(str(code))
+
+
+if __name__ == "__main__":
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    table = rank_openers(processes=processes)
+    print("Top openers:")
+    for word, score in table["openers"][:10]:
+        print(f"{word}: {score:.2f} expected remaining")
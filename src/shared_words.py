@@ -0,0 +1,341 @@
+from multiprocessing import resource_tracker, shared_memory
+import struct
+import weakref
+
+from src.game_logic import batch_feedback_codes, retrieve_word_list, word_columns
+
+# Segment layout (all integers native-endian uint32):
+#   header:       word_count, word_length, pattern_rows, reserved
+#   words:        word_count * word_length ASCII bytes, in input order
+#   sorted_index: word_count row ids, ordered by word (for lookups)
+#   letter_masks: word_count bitmasks, bit i set if chr(ord("a") + i) is in
+#                 the word (for cheap absent-letter checks)
+#   patterns:     pattern_rows * word_count feedback codes, one byte each;
+#                 row g holds feedback_code(words[g], words[s]) for every s
+_HEADER = struct.Struct("=4I")
+
+# Table attached by pool workers through init_worker().
+_worker_table = None
+
+
+def letter_mask(word):
+    """
+    Build a bitmask of the lowercase letters present in a word.
+
+    Args:
+        word (str): The word to encode.
+
+    Returns:
+        int: Bitmask with bit i set when chr(ord("a") + i) is in the word.
+
+    Example:
+        >>> letter_mask("abba")
+        3
+    """
+    mask = 0
+    for letter in word:
+        mask |= 1 << (ord(letter) - ord("a"))
+    return mask
+
+
+def build_pattern_matrix(words, rows=None):
+    """
+    Compute the feedback-pattern matrix for a word list.
+
+    Args:
+        words (list[str]): Words used as solutions (matrix columns).
+        rows (int, optional): Number of leading words used as guesses
+                              (matrix rows). Defaults to all words.
+
+    Returns:
+        bytearray: rows * len(words) feedback codes, row-major.
+
+    Note:
+        This is quadratic in the word count: each row is one
+        batch_feedback_codes() call, under 1 ms against a 15k word list, but
+        the full 15k x 15k matrix takes about 10 s and 225 MB. Publish only
+        the rows that are actually looked up, such as likely openers, and
+        let other guesses be computed in batch.
+    """
+    if rows is None:
+        rows = len(words)
+    columns = word_columns(words)
+    matrix = bytearray(rows * len(words))
+    offset = 0
+    for guess in words[:rows]:
+        matrix[offset : offset + len(words)] = batch_feedback_codes(guess, columns)
+        offset += len(words)
+    return matrix
+
+
+def _attach_untracked(name):
+    """
+    Open an existing segment without registering it for cleanup here.
+
+    The resource tracker unlinks every segment registered in a process when
+    that process exits, so an attaching process that registered the owner's
+    segment would remove it. Python 3.13+ skips the registration with
+    track=False; older versions always register, so the register call is
+    suppressed while the segment is opened. Unregistering afterwards is not
+    an option: pool workers share the owner's tracker, and it would drop the
+    owner's registration too.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+    register = resource_tracker.register
+
+    def register_others(resource, rtype):
+        if rtype != "shared_memory":
+            register(resource, rtype)
+
+    resource_tracker.register = register_others
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def _release(shm, unlink, views):
+    """
+    Release views, close a shared memory segment and optionally remove it.
+
+    The segment is removed even if closing fails (for example because a
+    caller still holds a view into it), since the finalizer runs only once.
+    """
+    try:
+        while views:
+            views.pop().release()
+        shm.close()
+    finally:
+        if unlink:
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class SharedWordTable:
+    """
+    Word table, indexes and pattern matrix stored in one shared segment.
+
+    The publishing process creates the table with create() and owns the
+    segment: it is unlinked when the owner calls unlink(), exits the context
+    manager, is garbage collected or the interpreter exits. If the owner is
+    killed, the multiprocessing resource tracker removes the segment.
+
+    Workers attach read-only with attach(name). Every accessor reads
+    straight from the shared buffer, so N workers share one copy. Accessors
+    return copies (str, int, bytes), never views, so nothing handed out
+    keeps the segment mapped after close().
+    """
+
+    def __init__(self, shm, owner):
+        self._shm = shm
+        self.owner = owner
+        buf = shm.buf.toreadonly()
+        count, length, pattern_rows, _ = _HEADER.unpack_from(buf, 0)
+        self.word_count = count
+        self.word_length = length
+        self.pattern_rows = pattern_rows
+
+        offset = _HEADER.size
+        self._words = buf[offset : offset + count * length]
+        offset += count * length
+        self._sorted_index = buf[offset : offset + 4 * count].cast("I")
+        offset += 4 * count
+        self._letter_masks = buf[offset : offset + 4 * count].cast("I")
+        offset += 4 * count
+        self._patterns = buf[offset : offset + pattern_rows * count]
+        self._views = [
+            buf,
+            self._words,
+            self._sorted_index,
+            self._letter_masks,
+            self._patterns,
+        ]
+        self._finalizer = weakref.finalize(self, _release, shm, owner, self._views)
+
+    @classmethod
+    def create(cls, words=None, patterns=None, name=None):
+        """
+        Publish a word table into a new shared memory segment.
+
+        Args:
+            words (list[str], optional): Words to publish. All words must be
+                                         ASCII and the same length. Defaults
+                                         to retrieve_word_list().
+            patterns (bytes | bytearray, optional): Pattern matrix from
+                build_pattern_matrix(words, rows). Defaults to None.
+            name (str, optional): Segment name. Defaults to a random name.
+
+        Returns:
+            SharedWordTable: The owning table.
+
+        Raises:
+            ValueError: If words differ in length or the pattern matrix size
+                        is not a multiple of the word count.
+        """
+        if words is None:
+            words = retrieve_word_list()
+        count = len(words)
+        length = len(words[0]) if words else 0
+        if any(len(word) != length for word in words):
+            raise ValueError("All words must have the same length.")
+        patterns = patterns or b""
+        if count and len(patterns) % count:
+            raise ValueError("Pattern matrix size must be rows * len(words).")
+        pattern_rows = len(patterns) // count if count else 0
+
+        size = _HEADER.size + count * (length + 8) + len(patterns)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        try:
+            buf = shm.buf
+            _HEADER.pack_into(buf, 0, count, length, pattern_rows, 0)
+            offset = _HEADER.size
+            buf[offset : offset + count * length] = "".join(words).encode("ascii")
+            offset += count * length
+            order = sorted(range(count), key=words.__getitem__)
+            struct.pack_into(f"={count}I", buf, offset, *order)
+            offset += 4 * count
+            masks = [letter_mask(word) for word in words]
+            struct.pack_into(f"={count}I", buf, offset, *masks)
+            offset += 4 * count
+            buf[offset : offset + len(patterns)] = patterns
+        except BaseException:
+            _release(shm, True, [])
+            raise
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        """
+        Attach read-only to a table published by another process.
+
+        Args:
+            name (str): The segment name of the published table.
+
+        Returns:
+            SharedWordTable: A non-owning view; closing it never removes the
+                             segment.
+        """
+        return cls(_attach_untracked(name), owner=False)
+
+    @property
+    def name(self):
+        """Name workers pass to attach()."""
+        return self._shm.name
+
+    def __len__(self):
+        return self.word_count
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += self.word_count
+        if not 0 <= row < self.word_count:
+            raise IndexError("word table index out of range")
+        start = row * self.word_length
+        return bytes(self._words[start : start + self.word_length]).decode("ascii")
+
+    def __iter__(self):
+        for row in range(self.word_count):
+            yield self[row]
+
+    def __contains__(self, word):
+        return self.index(word) is not None
+
+    def index(self, word):
+        """
+        Find the row of a word using the sorted index.
+
+        Args:
+            word (str): The word to look up.
+
+        Returns:
+            int | None: The row of the word, or None if absent.
+        """
+        sorted_index = self._sorted_index
+        low, high = 0, self.word_count
+        while low < high:
+            mid = (low + high) // 2
+            if self[sorted_index[mid]] < word:
+                low = mid + 1
+            else:
+                high = mid
+        if low < self.word_count and self[sorted_index[low]] == word:
+            return sorted_index[low]
+        return None
+
+    def columns(self):
+        """
+        Return word_columns() of the table, sliced from the shared buffer.
+
+        Each column is a strided copy of one letter position, word_count
+        bytes long, so no word is decoded to a string.
+        """
+        length = self.word_length
+        return tuple(bytes(self._words[pos::length]) for pos in range(length))
+
+    def letter_mask(self, row):
+        """Return the letter bitmask of the word at the given row."""
+        return self._letter_masks[row]
+
+    def pattern(self, guess_row, solution_row):
+        """
+        Look up a feedback code from the pattern matrix.
+
+        Args:
+            guess_row (int): Row of the guess, below pattern_rows.
+            solution_row (int): Row of the solution.
+
+        Returns:
+            int: The feedback code, as from feedback_code().
+        """
+        return self._patterns[guess_row * self.word_count + solution_row]
+
+    def pattern_row(self, guess_row):
+        """Return the feedback codes for one guess, one byte per solution."""
+        start = guess_row * self.word_count
+        return bytes(self._patterns[start : start + self.word_count])
+
+    def close(self):
+        """Release the views and the segment; owners also remove it."""
+        self._finalizer()
+
+    def unlink(self):
+        """Remove the segment. Only the owner may call this."""
+        if not self.owner:
+            raise PermissionError("Only the owning process may unlink.")
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def init_worker(name):
+    """
+    Pool initializer that attaches the worker to a published table.
+
+    Example:
+        >>> with SharedWordTable.create(words) as table:
+        ...     with Pool(32, init_worker, (table.name,)) as pool:
+        ...         pool.map(score, range(len(table)))
+    """
+    global _worker_table
+    _worker_table = SharedWordTable.attach(name)
+
+
+def worker_table():
+    """
+    Return the table attached by init_worker() in this process.
+
+    Raises:
+        RuntimeError: If init_worker() has not run in this process.
+    """
+    if _worker_table is None:
+        raise RuntimeError("No shared word table attached in this process.")
+    return _worker_table
@@ -0,0 +1,178 @@
+from collections import Counter, OrderedDict
+import os
+
+from src.letter_stats import LetterStats
+
+ROUTE_FORCED = "forced"
+ROUTE_LOCAL = "local"
+ROUTE_CACHE = "cache"
+ROUTE_OPENER = "opener"
+ROUTE_LLM = "llm"
+
+# Answers the model gave for a given game state, shared across games played
+# in the same process. The candidate set is fully determined by the history,
+# so a valid answer for one history stays valid for the same history. The
+# cache lives as long as the process, so it keeps only the most recently
+# used ANSWER_CACHE_SIZE histories.
+ANSWER_CACHE_SIZE = 4096
+_answer_cache = OrderedDict()
+
+
+def load_routing_policy():
+    """
+    Build the routing policy from environment variables.
+
+    Reads:
+      - ROUTER_LOCAL_THRESHOLD: answer locally when fewer candidates than
+        this remain (defaults to 3, 0 disables threshold routing).
+      - ROUTER_USE_CACHE: set to "0" to disable cached answers.
+      - ROUTER_LLM_LATENCY_ESTIMATE: seconds assumed per LLM round-trip when
+        no call has been timed yet (defaults to 2.0).
+
+    Returns:
+        dict: Policy with keys local_threshold, use_cache and
+              llm_latency_estimate.
+    """
+    return {
+        "local_threshold": int(os.getenv("ROUTER_LOCAL_THRESHOLD", "3")),
+        "use_cache": os.getenv("ROUTER_USE_CACHE", "1") != "0",
+        "llm_latency_estimate": float(os.getenv("ROUTER_LLM_LATENCY_ESTIMATE", "2.0")),
+    }
+
+
+def history_key(history):
+    """
+    Build a hashable key for a game history.
+
+    Args:
+        history (dict[str, list[int]]): Guess -> feedback for the game so far.
+
+    Returns:
+        tuple: Sorted (guess, feedback) pairs.
+    """
+    return tuple(sorted((guess, tuple(fb)) for guess, fb in history.items()))
+
+
+def local_guess(candidates, stats=None):
+    """
+    Pick a guess without calling the model.
+
+    Returns the candidate with the highest LetterStats.score(), so the local
+    answer still tends to split the remaining set.
+
+    Args:
+        candidates (list[str]): Non-empty list of remaining candidate words.
+        stats (LetterStats, optional): Statistics already synced to the
+                                       candidates. Defaults to counting them.
+
+    Returns:
+        str: The chosen candidate.
+
+    Example:
+        >>> local_guess(["crane", "crate", "trace", "slate"])
+        'crate'
+    """
+    if stats is None:
+        stats = LetterStats(candidates)
+    return stats.informative_words(candidates, k=1)[0]
+
+
+def route_turn(candidates, history, policy, stats=None):
+    """
+    Decide whether the next guess is answered locally or by the model.
+
+    Checks, in order:
+    1. A single remaining candidate is the forced answer.
+    2. Fewer candidates than the policy threshold are answered locally.
+    3. A previously cached model answer for the same history is reused.
+    Otherwise the turn is routed to the model.
+
+    Args:
+        candidates (list[str]): Candidates left after trim_list().
+        history (dict[str, list[int]]): Guess -> feedback for the game so far.
+        policy (dict): Policy from load_routing_policy().
+        stats (LetterStats, optional): Statistics for the candidates, used
+                                       to score local guesses.
+
+    Returns:
+        tuple[str, str | None]: The route and the guess to play, or None
+                                when the turn is routed to the model.
+    """
+    if len(candidates) == 1:
+        return ROUTE_FORCED, candidates[0]
+    if candidates and len(candidates) < policy["local_threshold"]:
+        return ROUTE_LOCAL, local_guess(candidates, stats)
+    if policy["use_cache"]:
+        key = history_key(history)
+        cached = _answer_cache.get(key)
+        if cached in candidates:
+            _answer_cache.move_to_end(key)
+            return ROUTE_CACHE, cached
+    return ROUTE_LLM, None
+
+
+def record_answer(history, guess):
+    """
+    Cache a valid model answer for the given history.
+
+    The least recently used answer is evicted once the cache holds
+    ANSWER_CACHE_SIZE histories.
+
+    Args:
+        history (dict[str, list[int]]): Guess -> feedback for the game so far.
+        guess (str): The validated guess returned by the model.
+    """
+    key = history_key(history)
+    _answer_cache[key] = guess
+    _answer_cache.move_to_end(key)
+    while len(_answer_cache) > ANSWER_CACHE_SIZE:
+        _answer_cache.popitem(last=False)
+
+
+class RouterStats:
+    """
+    Per-game counters for routed turns and LLM latency.
+
+    Tracks how many turns took each route and how long the model calls
+    took, and estimates the latency saved by turns that skipped the model.
+    """
+
+    def __init__(self, llm_latency_estimate=2.0):
+        self.routes = Counter()
+        self.llm_latencies = []
+        self.llm_latency_estimate = llm_latency_estimate
+
+    def record(self, route, llm_latency=None):
+        """Record one routed turn and, for model turns, its latency."""
+        self.routes[route] += 1
+        if llm_latency is not None:
+            self.llm_latencies.append(llm_latency)
+
+    def latency_saved(self):
+        """Estimate seconds saved by turns that did not call the model."""
+        if self.llm_latencies:
+            per_call = sum(self.llm_latencies) / len(self.llm_latencies)
+        else:
+            per_call = self.llm_latency_estimate
+        return self.local_count() * per_call
+
+    def local_count(self):
+        """Number of turns answered without calling the model."""
+        return sum(count for route, count in self.routes.items() if route != ROUTE_LLM)
+
+    def report(self):
+        """
+        Summarize routing for the game.
+
+        Returns:
+            str: Routed-local vs LLM counts and the estimated latency saved.
+        """
+        return (
+            f"ROUTING: local={self.local_count()} "
+            f"(forced={self.routes[ROUTE_FORCED]}, "
+            f"threshold={self.routes[ROUTE_LOCAL]}, "
+            f"cache={self.routes[ROUTE_CACHE]}, "
+            f"opener={self.routes[ROUTE_OPENER]}) "
+            f"llm={self.routes[ROUTE_LLM]} "
+            f"latency_saved={self.latency_saved():.2f}s"
+        )
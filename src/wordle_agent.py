@@ -1,19 +1,30 @@
 from collections import defaultdict
 from dotenv import load_dotenv
-from openai import OpenAI
-import os
 import random
 import re
+import time
 
+from src.game_hosts import make_host
 from src.game_logic import (
-    get_feedback,
+    encode_feedback,
     retrieve_word_list,
     trim_list,
-    random_word_select,
+)
+from src.letter_stats import LetterStats
+from src.llm_backends import BackendRateLimitError, get_backend
+from src.openers import load_opener_table, second_guess
+from src.strategy_router import (
+    ROUTE_LLM,
+    ROUTE_OPENER,
+    RouterStats,
+    load_routing_policy,
+    record_answer,
+    route_turn,
 )
 
 load_dotenv()
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+MAX_RATE_LIMIT_RETRIES = 5
 
 
 def feedback_explanation(turn, guess_list, feedback):
@@ -89,7 +100,172 @@ def extract_guess(ai_response_content):
     return guess_object
 
 
-def wordle_agent():
+def build_prompt(guess_list, feedback, fb_exp, wordle_words, common_letters):
+    """
+    Build the system prompt asking the model for the next guess.
+
+    Args:
+        guess_list (list[str]): Characters of the previous guess.
+        feedback (list[int]): Feedback values (0, 1, or 2) for the guess.
+        fb_exp (str): Explanation from feedback_explanation().
+        wordle_words (str): Comma separated informative remaining candidates.
+        common_letters (str): Comma separated letters that best split the
+                              remaining candidates.
+
+    Returns:
+        str: The prompt text.
+    """
+    return f"""You are acting as WordleBot.
+    Wordle is a game that has a predetermined 5 letter word as the
+    solution.
+    The user needs to guess what the solution is and they have 6 guesses
+    to do so.
+    You will receive a 5 letter word as the previous guess but in the
+    format of a list with 5 characters in it
+    Your aim is to help the user get to the solution quickly by giving
+    the next guess that the user should try.
+    The best case scenario is if your guess exactly matches the solution.
+
+    <data_definition>
+    For a given guess, you will be provided with the feedback.
+    Feedback is a list containing 5 items that are 0, 1 or 2.
+    0 implies that the corresponding letter is not present in the
+    solution.
+    1 implies that the corresponding letter is present at a different
+    position in the solution.
+    2 implies that the corresponding letter is present in the solution
+    and is in the correct position.
+
+    Example
+    Guess = 'adieu', Solution = 'bidet'
+    Feedback = [0, 1, 1, 2, 0]
+    This means that 'a' and 'u' are not in the solution
+    'd' and 'i' are in the solution but are not at positions 2 and 3
+    respectively
+    'e' is in the solution and is in the right position.
+    A good next guess would be a word like 'dices' since it satisfies all
+    the above criteria ie, 'a' and 'u' are not in the solution,
+    'd' and 'i' are not present in the same positions as in 'adieu' and
+    'e' is in the correct position.
+    </data_definition>
+
+    The current user guess is {guess_list} and feedback is {feedback},
+    which means {fb_exp}.
+    Given that there could be infinite guesses, there is a corpus
+    containing words used in wordle.
+    There is a tool to eliminate all words that do not meet the feedback
+    criteria from this corpus.
+
+    Example
+    Words like 'arrow' and 'weary' are removed from the corpus because
+    'a' should not be present, 'e' should be in the 4th position, 'd' and
+    'i' should be present
+
+    <choosing_a_good_guess>
+    1. These 20 words {wordle_words} are the most informative words in
+    the remaining corpus of valid words. Words like these are good guesses
+    2. Try to pick words with common letters like {common_letters}
+    3. Most words have atleast one vowel - a,e,i,o,u. So try to provide
+    guesses with vowels to maximize match criteria.
+    4. Every guess needs to be a real English word
+    5. Proper nouns are invalid guesses
+    </choosing_a_good_guess>
+
+    <guess_rules>
+    1. When feedback for a character is 2, then that character MUST be
+    present in THE SAME POSITION for all future guesses.
+    2. When feedback for a character is 1, then that character MUST be
+    present in a different position to gain new information
+    UNTIL feedback changes to 2 after which, it MUST be present in THE
+    SAME POSITION for all future guesses.
+    3. When feedback for a character is 0, it MUST NOT BE in ANY future
+    guesses.
+    </guess_rules>
+
+    <response_format>
+    AGENT GUESS: your chosen guess should be a 5 letter word that matches all
+    the above constraints.
+    <response_format>
+
+    Strict absolute constraints you cannot miss
+    1. Your guess should STRICTLY SATISFY the rules above.
+    2. Your guess needs to be a real English word
+    3. Your guess HAS to be a 5 letter word
+    """
+
+
+def llm_guess(guess, prompt, candidates, history, backend):
+    """
+    Ask the model for the next guess, retrying on invalid answers.
+
+    The model gets up to 5 attempts to return a guess that is in the
+    remaining candidates. Rate-limited calls are retried with exponential
+    backoff (or the delay the backend asked for) up to
+    MAX_RATE_LIMIT_RETRIES times without using up an attempt. After that a
+    random candidate is used.
+
+    Args:
+        guess (str): The previous guess.
+        prompt (str): System prompt from build_prompt().
+        candidates (list[str]): Candidates left after trim_list().
+        history (dict[str, list[int]]): Guess -> feedback for the game so far.
+        backend (OpenAIBackend | StubBackend): Backend from get_backend().
+
+    Returns:
+        tuple[str, bool]: The next guess and whether the model produced it.
+    """
+    messages = [{"role": "user", "content": guess}]
+    messages.append({"role": "system", "content": prompt})
+    valid_check = 0
+    rate_limited = 0
+    while True:
+        try:
+            ai_response_content = backend.complete(messages)
+        except BackendRateLimitError as error:
+            rate_limited += 1
+            if rate_limited > MAX_RATE_LIMIT_RETRIES:
+                guess = random.choice(candidates)
+                print("Agent rate limited.")
+                print(f"Random guess: {guess}")
+                return guess, False
+            delay = error.retry_after
+            if delay is None:
+                delay = 0.5 * 2 ** (rate_limited - 1)
+            print(f"Rate limited, retrying in {delay:.2f}s.")
+            time.sleep(delay)
+            continue
+        valid_check += 1
+        messages.append(
+            {
+                "role": "assistant",  # fmt: off
+                "content": ai_response_content,
+            }  # fmt: off
+        )
+        print(ai_response_content)
+        tmp_guess = extract_guess(ai_response_content)
+        if tmp_guess in candidates:
+            return tmp_guess, True
+        if valid_check == 5:
+            guess = random.choice(candidates)
+            print("Agent unable to pick valid guess.")
+            print(f"Random guess: {guess}")
+            return guess, False
+        invalid_guess_prompt = f"""Your guess {tmp_guess} is not
+        valid as it does not satisfy all the historical
+        constraints. For your reference, here are the historical
+        constraints - {history}.
+        Please make sure that the guess that you select satisfies
+        all the past constraints."""
+        messages.append(
+            {
+                "role": "system",  # fmt: off
+                "content": invalid_guess_prompt,
+            }  # fmt: off
+        )
+        print(f"{tmp_guess} does not satisfy all the historical constraints.")
+
+
+def wordle_agent(host=None, backend=None, words=None):
     """
     Run an interactive Wordle game session with AI-powered guess suggestions.
 
@@ -98,7 +274,8 @@ def wordle_agent():
     - Prompts the user for guesses each turn
     - Generates feedback for each guess
     - Filters candidate words based on feedback
-    - Uses OpenAI's GPT-4o-mini to suggest next guesses
+    - Uses the configured LLM backend (OpenAI's GPT-4o-mini by default) to
+      suggest next guesses
     - Tracks game history and provides victory message when solved
 
     The AI suggestions are based on:
@@ -108,18 +285,33 @@ def wordle_agent():
     - Valid English words only
 
     Args:
-        solution (str): The 5-letter solution word that the user is trying
-                        to guess.
+        host (str | FixedHost | AdversarialHost, optional): Game host,
+            "fixed" for a random solution chosen up front or "adversarial"
+            for a host that picks the worst-case feedback each turn.
+            Defaults to the WORDLE_HOST environment variable, or "fixed"
+            when unset. A host instance is reset with new_game() and reused,
+            so an AdversarialHost built once over the same words keeps its
+            cached opening partitions across games.
+        backend (OpenAIBackend | StubBackend, optional): Backend answering
+            the completion calls. Defaults to get_backend(), which reads
+            the LLM_BACKEND environment variable.
+        words (list[str], optional): Word list to play with, so callers
+            playing many games load it once. Defaults to
+            retrieve_word_list().
 
     Returns:
         None: The function prints output and manages game state interactively.
 
     Note:
-        - Requires OPENAI_API_KEY environment variable to be set
+        - Requires OPENAI_API_KEY environment variable to be set, unless
+          LLM_BACKEND=stub selects the offline StubBackend
         - Game runs for up to 6 turns
         - Requires user input via stdin for each guess
         - Uses retrieve_word_list() to get initial candidate pool (must be
           called before first trim_list call)
+        - Turns with a forced, small or cached candidate set are answered
+          locally (see strategy_router); the routing summary is printed at
+          the end of the game
 
     Example:
         >>> wordle_agent("CRANE")
@@ -128,19 +320,33 @@ def wordle_agent():
         ...
     """
     history = {}
-    candidates = retrieve_word_list()
-    solution = random.choice(candidates)
-    print("SOLUTION: ", solution)
-    guess = random.choice([w for w in candidates if w != solution])
+    candidates = retrieve_word_list() if words is None else words
+    if host is None or isinstance(host, str):
+        game_host = make_host(candidates, host)
+    else:
+        game_host = host
+        game_host.new_game()
+    print("SOLUTION: ", game_host.solution or "(adversarial)")
+    opener_table = load_opener_table()
+    if opener_table and opener_table["openers"][0][0] in candidates:
+        guess = opener_table["openers"][0][0]
+    else:
+        guess = random.choice(candidates)
+        while guess == game_host.solution:
+            guess = random.choice(candidates)
+    if backend is None:
+        backend = get_backend()
+    letter_stats = None
+    policy = load_routing_policy()
+    router_stats = RouterStats(policy["llm_latency_estimate"])
     for turn in range(6):
         guess_list = list(guess)
         print("GUESS: ", guess)
-        solution_list = list(solution)
-        feedback = get_feedback(guess_list, solution_list)
+        feedback = game_host.respond(guess)
         print("FEEDBACK: ", feedback)
         fb_exp = feedback_explanation(turn, guess_list, feedback)
         history[guess] = feedback
-        if guess == solution:
+        if guess == game_host.solution:
             Response = f"""
             You've done it!
             Your guess {guess} was the solution after all!
@@ -151,124 +357,31 @@ def wordle_agent():
             print(Response)
             break
         candidates = trim_list(guess, feedback, candidates)
+        if letter_stats is None:
+            # Built from the first trimmed list rather than the whole
+            # dictionary, then kept current by subtraction.
+            letter_stats = LetterStats(candidates)
+        else:
+            letter_stats.sync(candidates)
         print("REMAINING CANDIDATES: ", len(candidates))
-        random_candidates = random_word_select(candidates)
-        wordle_words = ", ".join(random_candidates)
-        Prompt = f"""You are acting as WordleBot.
-        Wordle is a game that has a predetermined 5 letter word as the
-        solution.
-        The user needs to guess what the solution is and they have 6 guesses
-        to do so.
-        You will receive a 5 letter word as the previous guess but in the
-        format of a list with 5 characters in it
-        Your aim is to help the user get to the solution quickly by giving
-        the next guess that the user should try.
-        The best case scenario is if your guess exactly matches the solution.
-
-        <data_definition>
-        For a given guess, you will be provided with the feedback.
-        Feedback is a list containing 5 items that are 0, 1 or 2.
-        0 implies that the corresponding letter is not present in the
-        solution.
-        1 implies that the corresponding letter is present at a different
-        position in the solution.
-        2 implies that the corresponding letter is present in the solution
-        and is in the correct position.
-
-        Example
-        Guess = 'adieu', Solution = 'bidet'
-        Feedback = [0, 1, 1, 2, 0]
-        This means that 'a' and 'u' are not in the solution
-        'd' and 'i' are in the solution but are not at positions 2 and 3
-        respectively
-        'e' is in the solution and is in the right position.
-        A good next guess would be a word like 'dices' since it satisfies all
-        the above criteria ie, 'a' and 'u' are not in the solution,
-        'd' and 'i' are not present in the same positions as in 'adieu' and
-        'e' is in the correct position.
-        </data_definition>
-
-        The current user guess is {guess_list} and feedback is {feedback},
-        which means {fb_exp}.
-        Given that there could be infinite guesses, there is a corpus
-        containing words used in wordle.
-        There is a tool to eliminate all words that do not meet the feedback
-        criteria from this corpus.
-
-        Example
-        Words like 'arrow' and 'weary' are removed from the corpus because
-        'a' should not be present, 'e' should be in the 4th position, 'd' and
-        'i' should be present
-
-        <choosing_a_good_guess>
-        1. These 20 words {wordle_words} are randomly chosen from the
-        remaining corpus of valid words. Words like these are good guesses
-        2. Try to pick words with common letters like s,t,h,r,y
-        3. Most words have atleast one vowel - a,e,i,o,u. So try to provide
-        guesses with vowels to maximize match criteria.
-        4. Every guess needs to be a real English word
-        5. Proper nouns are invalid guesses
-        </choosing_a_good_guess>
-
-        <guess_rules>
-        1. When feedback for a character is 2, then that character MUST be
-        present in THE SAME POSITION for all future guesses.
-        2. When feedback for a character is 1, then that character MUST be
-        present in a different position to gain new information
-        UNTIL feedback changes to 2 after which, it MUST be present in THE
-        SAME POSITION for all future guesses.
-        3. When feedback for a character is 0, it MUST NOT BE in ANY future
-        guesses.
-        </guess_rules>
-
-        <response_format>
-        AGENT GUESS: your chosen guess should be a 5 letter word that matches all
-        the above constraints.
-        <response_format>
-
-        Strict absolute constraints you cannot miss
-        1. Your guess should STRICTLY SATISFY the rules above.
-        2. Your guess needs to be a real English word
-        3. Your guess HAS to be a 5 letter word
-        """
-        valid_guess = True
-        messages = [{"role": "user", "content": guess}]
-        messages.append({"role": "system", "content": Prompt})
-        valid_check = 0
-        while valid_guess:
-            valid_check += 1
-            completion = client.chat.completions.create(
-                model="gpt-4o-mini", messages=messages, temperature=0
-            )
-            ai_response_content = completion.choices[0].message.content
-            messages.append(
-                {
-                    "role": "assistant",  # fmt: off
-                    "content": ai_response_content,
-                }  # fmt: off
-            )
-            print(ai_response_content)
-            tmp_guess = extract_guess(ai_response_content)
-            if tmp_guess in candidates:
-                guess = tmp_guess
-                break
-            else:
-                if valid_check == 5:
-                    guess = random.choice(candidates)
-                    print("Agent unable to pick valid guess.")
-                    print(f"Random guess: {guess}")
-                    break
-                else:
-                    invalid_guess_prompt = f"""Your guess {tmp_guess} is not
-                    valid as it does not satisfy all the historical
-                    constraints. For your reference, here are the historical
-                    constraints - {history}.
-                    Please make sure that the guess that you select satisfies
-                    all the past constraints."""
-                    messages.append(
-                        {
-                            "role": "system",  # fmt: off
-                            "content": invalid_guess_prompt,
-                        }  # fmt: off
-                    )
-                    print(f"{tmp_guess} does not satisfy all the historical constraints.")
+        route, routed_guess = route_turn(candidates, history, policy, letter_stats)
+        if route == ROUTE_LLM and turn == 0 and opener_table:
+            precomputed = second_guess(opener_table, guess, encode_feedback(feedback))
+            if precomputed in candidates:
+                route, routed_guess = ROUTE_OPENER, precomputed
+        if route != ROUTE_LLM:
+            print(f"ROUTED {route.upper()}: {routed_guess}")
+            router_stats.record(route)
+            guess = routed_guess
+            continue
+        wordle_words = ", ".join(letter_stats.informative_words(candidates))
+        common_letters = ",".join(letter_stats.informative_letters())
+        prompt = build_prompt(
+            guess_list, feedback, fb_exp, wordle_words, common_letters
+        )
+        start = time.perf_counter()
+        guess, from_model = llm_guess(guess, prompt, candidates, history, backend)
+        router_stats.record(ROUTE_LLM, time.perf_counter() - start)
+        if from_model:
+            record_answer(history, guess)
+    print(router_stats.report())
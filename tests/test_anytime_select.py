@@ -0,0 +1,91 @@
+"""Unit tests for anytime_select module."""
+
+import random
+import time
+
+from src.anytime_select import bucket_score, sampled_score, select_guess
+
+CANDIDATES = [
+    "crane",
+    "plane",
+    "slate",
+    "crate",
+    "trace",
+    "react",
+    "caret",
+    "cater",
+    "grate",
+    "irate",
+    "abbey",
+    "shine",
+]
+
+
+class TestSampledScore:
+    """Tests for sampled_score function."""
+
+    def test_all_distinct_feedback(self):
+        """Test that a guess separating every word scores 1 / n."""
+        assert sampled_score("crane", ["crane", "crate", "trace"]) == 1 / 3
+
+    def test_no_information(self):
+        """Test that a guess giving identical feedback scores 1."""
+        assert sampled_score("zzzzz", ["crane", "crate", "trace"]) == 1.0
+
+
+class TestBucketScore:
+    """Tests for bucket_score function."""
+
+    def test_squared_bucket_sizes(self):
+        """Test the score of buckets sized 2 and 1."""
+        assert bucket_score(b"\x05\x05\x07") == 5 / 9
+
+
+class TestSelectGuess:
+    """Tests for select_guess function."""
+
+    def test_empty_candidates(self):
+        """Test that no candidates gives no guess."""
+        assert select_guess([], 10) == (None, 0.0)
+
+    def test_two_candidates(self):
+        """Test that with two candidates the first is played directly."""
+        assert select_guess(["crane", "crate"], 10) == ("crane", 1.0)
+
+    def test_exact_with_enough_time(self):
+        """Test that a generous budget finds an exact best guess."""
+        guess, confidence = select_guess(
+            CANDIDATES,
+            deadline_ms=1000,
+            rng=random.Random(0),
+            initial_sample=len(CANDIDATES),
+        )
+        best = min(sampled_score(word, CANDIDATES) for word in CANDIDATES)
+        assert confidence == 1.0
+        assert sampled_score(guess, CANDIDATES) == best
+
+    def test_guesses_outside_candidates(self):
+        """Test that guesses may come from a separate word list."""
+        guesses = ["zzzzz", "crane"]
+        guess, _ = select_guess(CANDIDATES, 1000, guesses=guesses, rng=random.Random(0))
+        assert guess == "crane"
+
+    def test_zero_budget_still_answers(self):
+        """Test that an exhausted budget returns a guess with no confidence."""
+        guess, confidence = select_guess(CANDIDATES, 0, rng=random.Random(0))
+        assert guess in CANDIDATES
+        assert confidence == 0.0
+
+    def test_latency_bounded_on_large_dictionary(self):
+        """Test that a large candidate list does not blow the budget."""
+        rng = random.Random(0)
+        letters = "abcdefghijklmnopqrstuvwxyz"
+        candidates = [
+            "".join(rng.choice(letters) for _ in range(5)) for _ in range(200000)
+        ]
+        start = time.perf_counter()
+        guess, confidence = select_guess(candidates, 20, rng=rng)
+        elapsed = time.perf_counter() - start
+        assert guess in candidates
+        assert 0.0 < confidence < 1.0
+        assert elapsed < 0.2
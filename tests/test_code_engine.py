@@ -0,0 +1,127 @@
+"""Unit tests for code_engine module."""
+
+import random
+from array import array
+
+import pytest
+
+from src.code_engine import (
+    CodeSpace,
+    FeedbackEngine,
+    SCORING_COUNTS,
+    bulls_and_cows,
+    count_feedback,
+    mastermind,
+    wordle,
+)
+from src.game_logic import feedback_code, trim_list, decode_feedback
+
+
+def _brute_force(engine, guess, feedback):
+    space = engine.space
+    code = space.encode(guess)
+    return array(
+        "I",
+        [i for i in range(len(space)) if engine.score(code, space[i]) == feedback],
+    )
+
+
+class TestCodeSpace:
+    """Tests for CodeSpace class."""
+
+    @pytest.mark.parametrize(
+        "space",
+        [
+            CodeSpace("123456", 4),
+            CodeSpace("0123456789", 3, repetition=False),
+            CodeSpace.from_words(["crane", "plane", "abbey"]),
+        ],
+    )
+    def test_ranks_round_trip(self, space):
+        """Test that ranks, codes and symbols agree with iteration order."""
+        for index, code in space.iter_codes():
+            assert space[index] == code
+            assert space.index(space.symbols(index)) == index
+
+    def test_sizes(self):
+        """Test the sizes of the standard spaces."""
+        assert len(CodeSpace("123456", 4)) == 1296
+        assert len(CodeSpace("0123456789", 4, repetition=False)) == 5040
+
+    def test_large_space_is_lazy(self):
+        """Test that a 10^7 code space decodes without materializing."""
+        space = CodeSpace("0123456789", 7)
+        assert len(space) == 10**7
+        assert space.symbols(len(space) - 1) == "9999999"
+        assert space.index("0000042") == 42
+
+    def test_invalid_codes(self):
+        """Test that codes outside the space are rejected."""
+        with pytest.raises(ValueError):
+            CodeSpace("0123456789", 4, repetition=False).index("1123")
+        with pytest.raises(ValueError):
+            CodeSpace.from_words(["crane", "plane"]).index("ranep")
+        with pytest.raises(ValueError):
+            CodeSpace("01", 3, repetition=False)
+        with pytest.raises(IndexError):
+            CodeSpace("01", 2)[4]
+
+
+class TestCountFeedback:
+    """Tests for count_feedback function."""
+
+    def test_mastermind_examples(self):
+        """Test bulls and cows counts with repeated symbols."""
+        assert count_feedback((1, 1, 2, 2), (1, 2, 1, 3)) == (1, 2)
+        assert count_feedback((1, 1, 1, 1), (1, 2, 3, 4)) == (1, 0)
+        assert count_feedback((1, 2, 3, 4), (4, 3, 2, 1)) == (0, 4)
+
+
+class TestFeedbackEngine:
+    """Tests for FeedbackEngine class."""
+
+    @pytest.mark.parametrize("engine", [mastermind(), bulls_and_cows()])
+    def test_filter_matches_brute_force(self, engine):
+        """Test the pruned full-space scan against checking every code."""
+        rng = random.Random(0)
+        space = engine.space
+        for _ in range(20):
+            guess = space.symbols(rng.randrange(len(space)))
+            secret = space.symbols(rng.randrange(len(space)))
+            feedback = engine.feedback(guess, secret)
+            result = engine.filter(guess, feedback)
+            assert result == _brute_force(engine, guess, feedback)
+            assert space.index(secret) in result
+
+    def test_filter_narrows_alive_set(self):
+        """Test that filtering twice keeps only consistent codes."""
+        engine = mastermind()
+        alive = engine.filter("1122", engine.feedback("1122", "1344"))
+        alive = engine.filter("1344", (4, 0), alive)
+        assert [engine.space.symbols(i) for i in alive] == ["1344"]
+
+    def test_knuth_first_guess_partition(self):
+        """Test a known Mastermind partition size for the opener 1122."""
+        assert len(mastermind().filter("1122", (0, 0))) == 256
+
+    def test_wordle_matches_trim_list(self):
+        """Test that the Wordle preset agrees with trim_list."""
+        words = ["crane", "plane", "slate", "crate", "trace", "react"]
+        engine = wordle(words)
+        feedback = engine.feedback("crane", "trace")
+        assert feedback == feedback_code("crane", "trace")
+        kept = [engine.space.symbols(i) for i in engine.filter("crane", feedback)]
+        assert kept == trim_list("crane", decode_feedback(feedback), words)
+
+    def test_large_space_filter(self):
+        """Test filtering a 10^6 code space keeps only ranks."""
+        engine = FeedbackEngine(CodeSpace("0123456789", 6), SCORING_COUNTS)
+        result = engine.filter("012345", (0, 0))
+        assert len(result) == 4**6
+        assert result.typecode == "I"
+        assert engine.space.symbols(result[0]) == "666666"
+
+    def test_unknown_scoring(self):
+        """Test that an unknown scoring rule raises ValueError."""
+        with pytest.raises(ValueError):
+            FeedbackEngine(CodeSpace("01", 2), "vibes")
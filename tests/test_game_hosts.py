@@ -0,0 +1,150 @@
+"""Unit tests for game_hosts module."""
+
+from collections import Counter
+import os
+import random
+from unittest.mock import patch
+
+import pytest
+
+from src.game_hosts import (
+    AdversarialHost,
+    FixedHost,
+    HOST_ADVERSARIAL,
+    HOST_FIXED,
+    _largest_bucket,
+    _SAMPLE_MIN_WORDS,
+    make_host,
+)
+from src.game_logic import feedback_code, get_feedback
+from src.shared_words import SharedWordTable, build_pattern_matrix
+
+WORDS = ["crane", "plane", "slate", "crate", "trace", "abbey", "react"]
+
+
+class TestFixedHost:
+    """Tests for FixedHost class."""
+
+    def test_respond(self):
+        """Test that feedback is computed against the fixed solution."""
+        host = FixedHost("plane")
+        assert host.respond("crane") == [0, 0, 2, 2, 2]
+        assert host.solution == "plane"
+
+
+def _counter_largest(codes):
+    sizes = Counter(codes)
+    return max(sizes, key=lambda code: (sizes[code], -code))
+
+
+class TestLargestBucket:
+    """Tests for _largest_bucket function on inputs large enough to sample."""
+
+    def test_tie_goes_to_lowest_code(self):
+        """Test that equal buckets resolve to the lowest code."""
+        codes = bytes([5, 3] * _SAMPLE_MIN_WORDS)
+        assert _largest_bucket(codes) == 3
+
+    def test_winner_missed_by_sample(self):
+        """Test that a largest bucket absent from the sample is still found."""
+        # The sample takes every 8th code, which is never 200.
+        codes = bytes(1 if i % 8 == 0 else 200 for i in range(2048))
+        assert _largest_bucket(codes) == 200
+
+    def test_tie_with_code_missed_by_sample(self):
+        """Test a tie between a sampled code and a lower unsampled one."""
+        # Every 8th code is sampled: 10 is, 4 is not, both have 512 words.
+        pattern = [10, 10, 4, 4, 20, 21, 22, 23]
+        codes = bytes(pattern[i % 8] for i in range(2048))
+        assert _largest_bucket(codes) == 4
+
+    def test_matches_counter(self):
+        """Test random inputs against a plain Counter."""
+        rng = random.Random(0)
+        for _ in range(200):
+            size = rng.randrange(_SAMPLE_MIN_WORDS, 4 * _SAMPLE_MIN_WORDS)
+            alphabet = rng.sample(range(243), rng.randrange(1, 20))
+            weights = [rng.random() ** 4 for _ in alphabet]
+            codes = bytes(rng.choices(alphabet, weights, k=size))
+            assert _largest_bucket(codes) == _counter_largest(codes)
+
+
+class TestAdversarialHost:
+    """Tests for AdversarialHost class."""
+
+    def test_keeps_largest_bucket(self):
+        """Test that the host keeps the largest feedback bucket."""
+        host = AdversarialHost(WORDS)
+        feedback = host.respond("abbey")
+        remaining = host.remaining()
+        assert all(get_feedback("abbey", word) == feedback for word in remaining)
+        sizes = host.partition("abbey", range(len(WORDS)))
+        assert len(remaining) == max(len(rows) for rows in sizes.values())
+        assert host.solution is None
+
+    def test_partition_covers_all_rows(self):
+        """Test that the buckets partition the given rows by feedback code."""
+        host = AdversarialHost(WORDS)
+        buckets = host.partition("crane", range(len(WORDS)))
+        assert sorted(i for rows in buckets.values() for i in rows) == list(
+            range(len(WORDS))
+        )
+        for code, rows in buckets.items():
+            assert all(feedback_code("crane", WORDS[i]) == code for i in rows)
+
+    def test_matches_feedback_code(self):
+        """Test that batched codes match feedback_code on a subset of rows."""
+        host = AdversarialHost(WORDS)
+        rows = [5, 0, 3]
+        codes = host.feedback_codes("trace", rows)
+        assert list(codes) == [feedback_code("trace", WORDS[i]) for i in rows]
+
+    def test_game_ends_when_only_guess_remains(self):
+        """Test that the solution is fixed once the guess is forced."""
+        host = AdversarialHost(["crane"])
+        assert host.respond("crane") == [2, 2, 2, 2, 2]
+        assert host.solution == "crane"
+
+    def test_new_game_resets_and_reuses_opening(self):
+        """Test that new_game resets state and reuses the opening bucket."""
+        host = AdversarialHost(WORDS)
+        first = host.respond("slate")
+        host.respond(host.remaining()[0])
+        host.new_game()
+        assert host.remaining() == WORDS
+        with patch.object(host, "feedback_codes") as codes:
+            assert host.respond("slate") == first
+        codes.assert_not_called()
+
+    def test_uses_shared_pattern_matrix(self):
+        """Test that a SharedWordTable pattern matrix gives the same play."""
+        patterns = build_pattern_matrix(WORDS)
+        with SharedWordTable.create(WORDS, patterns) as table:
+            shared = AdversarialHost(table)
+            plain = AdversarialHost(WORDS)
+            for guess in ["crane", "trace"]:
+                assert shared.respond(guess) == plain.respond(guess)
+                assert shared.remaining() == plain.remaining()
+            with patch("src.game_hosts.batch_feedback_codes") as codes:
+                shared.feedback_codes("crate", range(len(WORDS)))
+            codes.assert_not_called()
+
+
+class TestMakeHost:
+    """Tests for make_host function."""
+
+    def test_fixed(self):
+        """Test that the fixed host picks a solution from the candidates."""
+        host = make_host(WORDS, HOST_FIXED)
+        assert isinstance(host, FixedHost)
+        assert host.solution in WORDS
+
+    def test_adversarial_from_env(self):
+        """Test that WORDLE_HOST selects the adversarial host."""
+        with patch.dict(os.environ, {"WORDLE_HOST": HOST_ADVERSARIAL}):
+            assert isinstance(make_host(WORDS), AdversarialHost)
+
+    def test_unknown(self):
+        """Test that an unknown host raises ValueError."""
+        with pytest.raises(ValueError):
+            make_host(WORDS, "cheating")
@@ -1,5 +1,6 @@
 """Unit tests for game_logic module."""
 
+import itertools
 import os
 import tempfile
 from unittest.mock import patch
@@ -9,9 +10,16 @@ import pytest
 from src.game_logic import (
     retrieve_word_list,
     get_feedback,
+    encode_feedback,
+    decode_feedback,
+    feedback_code,
+    batch_feedback_codes,
+    word_columns,
     cow_bull_absent,
     filter_candidates,
     trim_list,
+    trim_list_regex,
+    compile_constraint_pattern,
     random_word_select,
 )
 
@@ -105,6 +113,52 @@ class TestGetFeedback:
         assert feedback == [0, 1, 2, 1, 2]
 
 
+class TestFeedbackCodes:
+    """Tests for encode_feedback, decode_feedback and feedback_code."""
+
+    def test_encode_decode_round_trip(self):
+        """Test that every feedback survives encoding and decoding."""
+        codes = set()
+        for code in range(3**5):
+            feedback = decode_feedback(code)
+            assert encode_feedback(feedback) == code
+            codes.add(tuple(feedback))
+        assert len(codes) == 3**5
+
+    def test_all_bulls_is_max_code(self):
+        """Test that a solved feedback has the highest code."""
+        assert encode_feedback([2, 2, 2, 2, 2]) == 3**5 - 1
+
+    @pytest.mark.parametrize(
+        "guess,solution",
+        [
+            ("crane", "crane"),
+            ("crane", "plane"),
+            ("crane", "react"),
+            ("speed", "abide"),
+            ("eerie", "elder"),
+            ("banns", "pawns"),
+        ],
+    )
+    def test_feedback_code_matches_get_feedback(self, guess, solution):
+        """Test that feedback_code agrees with get_feedback."""
+        expected = encode_feedback(get_feedback(guess, solution))
+        assert feedback_code(guess, solution) == expected
+
+    def test_batch_matches_feedback_code(self):
+        """Test batched codes against feedback_code, duplicates included."""
+        words = ["".join(letters) for letters in itertools.product("abc", repeat=5)]
+        columns = word_columns(words)
+        for guess in words:
+            expected = bytes(feedback_code(guess, word) for word in words)
+            assert batch_feedback_codes(guess, columns) == expected
+
+    def test_batch_rejects_long_words(self):
+        """Test that codes which would not fit in a byte are refused."""
+        with pytest.raises(ValueError):
+            batch_feedback_codes("abcdef", word_columns(["abcdef"]))
+
+
 class TestCowBullAbsent:
     """Tests for cow_bull_absent function."""
 
@@ -289,6 +343,59 @@ class TestTrimList:
         assert "panns" not in result  # has n at pos 2 (excluded_position)
 
 
+class TestTrimListRegex:
+    """Tests for the regex filter backend."""
+
+    CANDIDATES = ["CRANE", "PLANE", "CRATE", "SLATE", "REACT", "EERIE", "ELDER"]
+
+    @pytest.mark.parametrize(
+        "guess,solution",
+        [
+            ("CRANE", "PLANE"),
+            ("CRANE", "REACT"),
+            ("CRANE", "CRANE"),
+            ("EERIE", "ELDER"),
+            ("SLATE", "CRATE"),
+            ("ABCDE", "FGHIJ"),
+        ],
+    )
+    def test_matches_python_backend(self, guess, solution):
+        """Test that the regex backend keeps the same words in order."""
+        feedback = get_feedback(guess, solution)
+        expected = trim_list(guess, feedback, self.CANDIDATES, backend="python")
+        result = trim_list_regex(guess, feedback, self.CANDIDATES)
+        assert result == expected
+        assert solution not in self.CANDIDATES or solution in result
+
+    def test_empty_candidates(self):
+        """Test that an empty candidate list stays empty."""
+        assert trim_list_regex("CRANE", [0, 0, 2, 2, 2], []) == []
+
+    def test_selected_by_backend_argument(self):
+        """Test that trim_list dispatches to the regex backend."""
+        result = trim_list("CRANE", [0, 0, 2, 2, 2], self.CANDIDATES, "regex")
+        assert result == ["PLANE"]
+
+    def test_selected_by_env_var(self):
+        """Test that FILTER_BACKEND selects the regex backend."""
+        with patch.dict(os.environ, {"FILTER_BACKEND": "regex"}):
+            with patch("src.game_logic.trim_list_regex") as regex:
+                trim_list("CRANE", [0, 0, 2, 2, 2], self.CANDIDATES)
+        regex.assert_called_once()
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend raises ValueError."""
+        with pytest.raises(ValueError):
+            trim_list("CRANE", [0, 0, 2, 2, 2], self.CANDIDATES, "numpy")
+
+    def test_patterns_are_cached(self):
+        """Test that the same constraint state reuses the compiled pattern."""
+        compile_constraint_pattern.cache_clear()
+        trim_list_regex("CRANE", [0, 0, 2, 2, 2], self.CANDIDATES)
+        trim_list_regex("CRANE", [0, 0, 2, 2, 2], ["PLANE"])
+        assert compile_constraint_pattern.cache_info().hits == 1
+
+
 class TestRandomWordSelect:
     """Tests for random_word_select function."""
 
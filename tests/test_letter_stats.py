@@ -0,0 +1,70 @@
+"""Unit tests for letter_stats module."""
+
+from src.game_logic import get_feedback, trim_list
+from src.letter_stats import LetterStats
+
+WORDS = ["crane", "plane", "slate", "crate", "trace", "react", "shine", "abbey"]
+
+
+class TestLetterStats:
+    """Tests for LetterStats class."""
+
+    def test_counts(self):
+        """Test positional and document counts."""
+        stats = LetterStats(["abbey", "crane"])
+        assert stats.document["b"] == 1
+        assert stats.document["a"] == 2
+        assert stats.positional[1]["b"] == 1
+        assert stats.positional[2]["b"] == 1
+        assert len(stats) == 2
+
+    def test_sync_matches_recount(self):
+        """Test that incremental updates equal counting from scratch."""
+        stats = LetterStats(WORDS)
+        feedback = get_feedback("crane", "trace")
+        candidates = trim_list("crane", feedback, WORDS)
+        removed = stats.sync(candidates)
+        fresh = LetterStats(candidates)
+        assert removed == len(WORDS) - len(candidates)
+        assert +stats.document == +fresh.document
+        assert [+c for c in stats.positional] == [+c for c in fresh.positional]
+
+    def test_remove_matches_recount(self):
+        """Test that subtracting a few removed words equals a recount."""
+        stats = LetterStats(WORDS)
+        stats.remove(["abbey", "shine", "not-tracked"])
+        fresh = LetterStats(WORDS[:6])
+        assert len(stats) == 6
+        assert +stats.document == +fresh.document
+        assert [+c for c in stats.positional] == [+c for c in fresh.positional]
+
+    def test_scorer_matches_score(self):
+        """Test that bulk scoring and informative_words agree with score()."""
+        stats = LetterStats(WORDS)
+        score = stats.scorer()
+        assert [score(word) for word in WORDS] == [stats.score(w) for w in WORDS]
+        ranked = sorted(WORDS, key=lambda word: (-stats.score(word), word))
+        assert stats.informative_words(WORDS, k=4) == ranked[:4]
+
+    def test_informative_letters_skip_letters_in_every_word(self):
+        """Test that letters in all candidates are not suggested."""
+        stats = LetterStats(["crane", "plane", "slate"])
+        letters = stats.informative_letters(k=10)
+        assert "a" not in letters
+        assert "e" not in letters
+        assert sorted(letters) == ["c", "l", "n", "p", "r", "s", "t"]
+
+    def test_position_hints(self):
+        """Test the most common letter per position."""
+        stats = LetterStats(["crane", "crate", "plane"])
+        assert stats.position_hints() == ["c", "r", "a", "n", "e"]
+        stats.sync([])
+        assert stats.position_hints() == [None] * 5
+
+    def test_informative_words_prefers_splitting_words(self):
+        """Test that words sharing letters with part of the set rank first."""
+        stats = LetterStats(WORDS)
+        best = stats.informative_words(WORDS, k=3)
+        assert len(best) == 3
+        assert stats.score(best[0]) >= stats.score(best[-1])
+        assert "abbey" not in best
@@ -0,0 +1,170 @@
+"""Unit tests for llm_backends module."""
+
+import json
+import os
+import urllib.error
+import urllib.request
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.llm_backends import (
+    BackendRateLimitError,
+    LLM_BACKEND_STUB,
+    OpenAIBackend,
+    StubBackend,
+    get_backend,
+    serve_stub,
+)
+from src.wordle_agent import extract_guess
+
+MESSAGES = [
+    {"role": "user", "content": "crane"},
+    {"role": "system", "content": "1. These 20 words plane, slate are good"},
+]
+
+
+def _post(url, body):
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(body).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())
+
+
+class TestOpenAIBackend:
+    """Tests for OpenAIBackend class."""
+
+    def _rate_limited(self, retry_after):
+        openai = pytest.importorskip("openai")
+        response = SimpleNamespace(
+            request=None, status_code=429, headers={"retry-after": retry_after}
+        )
+
+        def create(**kwargs):
+            raise openai.RateLimitError("Rate limited", response=response, body=None)
+
+        client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+        with pytest.raises(BackendRateLimitError) as error:
+            OpenAIBackend(client=client).complete(MESSAGES)
+        return error.value.retry_after
+
+    def test_retry_after_seconds(self):
+        """Test that a Retry-After in seconds is passed on."""
+        assert self._rate_limited("1.5") == 1.5
+
+    def test_retry_after_http_date(self):
+        """Test that a Retry-After date falls back to the agent's backoff."""
+        assert self._rate_limited("Wed, 21 Oct 2026 07:28:00 GMT") is None
+        assert self._rate_limited("-1") is None
+
+    def test_default_client_does_not_retry(self):
+        """Test that the default client leaves retries to the agent."""
+        pytest.importorskip("openai")
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test"}):
+            assert OpenAIBackend().client.max_retries == 0
+
+
+class TestStubBackend:
+    """Tests for StubBackend class."""
+
+    def test_answers_with_suggested_word(self):
+        """Test that well-formed answers pick a suggested word."""
+        backend = StubBackend(seed=1)
+        for _ in range(20):
+            assert extract_guess(backend.complete(MESSAGES)) in ["plane", "slate"]
+
+    def test_deterministic_for_seed(self):
+        """Test that the same seed gives the same answers."""
+        first = [StubBackend(seed=3).complete(MESSAGES) for _ in range(5)]
+        second = [StubBackend(seed=3).complete(MESSAGES) for _ in range(5)]
+        assert first == second
+
+    def test_malformed_answers(self):
+        """Test that malformed answers never yield a suggested word."""
+        backend = StubBackend(malformed_rate=1.0)
+        for _ in range(20):
+            assert extract_guess(backend.complete(MESSAGES)) not in [
+                "plane",
+                "slate",
+            ]
+
+    def test_rate_limit(self):
+        """Test that rate limits raise BackendRateLimitError."""
+        backend = StubBackend(rate_limit_rate=1.0)
+        with pytest.raises(BackendRateLimitError) as error:
+            backend.complete(MESSAGES)
+        assert error.value.retry_after == 0
+        assert backend.calls == 1
+
+    def test_simulated_latency(self):
+        """Test that latency is drawn when configured."""
+        backend = StubBackend(latency_ms=5)
+        with patch("src.llm_backends.time.sleep") as sleep:
+            backend.complete(MESSAGES)
+        assert sleep.call_args[0][0] > 0
+
+
+class TestGetBackend:
+    """Tests for get_backend function."""
+
+    def test_stub_from_env(self):
+        """Test that LLM_BACKEND selects the configured stub."""
+        env = {"LLM_BACKEND": LLM_BACKEND_STUB, "STUB_MALFORMED_RATE": "0.5"}
+        with patch.dict(os.environ, env):
+            backend = get_backend()
+        assert isinstance(backend, StubBackend)
+        assert backend.malformed_rate == 0.5
+
+    def test_unknown(self):
+        """Test that an unknown backend raises ValueError."""
+        with pytest.raises(ValueError):
+            get_backend("carrier-pigeon")
+
+
+class TestServeStub:
+    """Tests for serve_stub function."""
+
+    def setup_method(self):
+        self.stub = StubBackend()
+        self.server = serve_stub(self.stub)
+
+    def teardown_method(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_chat_completion(self):
+        """Test that the server returns a chat completion."""
+        url = f"{self.server.base_url}/chat/completions"
+        body = _post(url, {"model": "gpt-4o-mini", "messages": MESSAGES})
+        assert body["object"] == "chat.completion"
+        assert body["model"] == "gpt-4o-mini"
+        content = body["choices"][0]["message"]["content"]
+        assert extract_guess(content) in ["plane", "slate"]
+
+    def test_rate_limit_is_429(self):
+        """Test that rate limits are returned as HTTP 429."""
+        self.stub.rate_limit_rate = 1.0
+        url = f"{self.server.base_url}/chat/completions"
+        with pytest.raises(urllib.error.HTTPError) as error:
+            _post(url, {"messages": MESSAGES})
+        assert error.value.code == 429
+        assert error.value.headers["Retry-After"] == "0"
+
+    def test_openai_client_round_trip(self):
+        """Test that the OpenAI client works against the stand-in."""
+        openai = pytest.importorskip("openai")
+        client = openai.OpenAI(
+            api_key="stub", base_url=self.server.base_url, max_retries=0
+        )
+        backend = OpenAIBackend(client=client)
+        assert extract_guess(backend.complete(MESSAGES)) in ["plane", "slate"]
+        self.stub.rate_limit_rate = 1.0
+        with pytest.raises(BackendRateLimitError) as error:
+            backend.complete(MESSAGES)
+        assert error.value.retry_after == 0
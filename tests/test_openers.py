@@ -0,0 +1,165 @@
+"""Unit tests for openers module."""
+
+from collections import Counter
+import json
+
+import pytest
+
+from src.game_logic import feedback_code
+from src.openers import (
+    _fingerprint,
+    best_second_guesses,
+    load_opener_table,
+    rank_openers,
+    score_opener,
+    second_guess,
+)
+
+WORDS = [
+    "crane",
+    "plane",
+    "slate",
+    "abbey",
+    "react",
+    "trace",
+    "crate",
+    "lemon",
+    "melon",
+    "light",
+    "might",
+    "night",
+]
+
+
+class TestScoreOpener:
+    """Tests for score_opener function."""
+
+    def test_expected_remaining(self):
+        """Test the expected bucket size for a hand-checked case."""
+        # "abbey" gets a distinct feedback from every word but itself.
+        assert score_opener("abbey", ["abbey", "crane"]) == 1.0
+        assert score_opener("zzzzz", ["abbey", "crane"]) == 2.0
+
+    def test_matches_feedback_code(self):
+        """Test that the batched score matches counting per-word codes."""
+        for opener in WORDS:
+            buckets = Counter(feedback_code(opener, word) for word in WORDS)
+            expected = sum(size * size for size in buckets.values()) / len(WORDS)
+            assert score_opener(opener, WORDS) == pytest.approx(expected)
+
+    def test_better_opener_scores_lower(self):
+        """Test that an opener splitting the list more scores lower."""
+        assert score_opener("night", WORDS) > score_opener("crate", WORDS)
+
+
+class TestBestSecondGuesses:
+    """Tests for best_second_guesses function."""
+
+    def test_one_guess_per_feedback(self):
+        """Test that every feedback gets a guess from its own bucket."""
+        second = best_second_guesses("crane", WORDS)
+        codes = {feedback_code("crane", word) for word in WORDS}
+        assert set(second) == codes
+        for code, guess in second.items():
+            assert feedback_code("crane", guess) == code
+
+
+class TestRankOpeners:
+    """Tests for rank_openers function."""
+
+    def test_writes_ranked_table(self, tmp_path):
+        """Test that the table is ranked, complete and saved to disk."""
+        path = tmp_path / "openers.json"
+        table = rank_openers(
+            WORDS, table_path=str(path), processes=2, chunk_size=5, second_guess_top=2
+        )
+        scores = [score for _, score in table["openers"]]
+        assert sorted(word for word, _ in table["openers"]) == sorted(WORDS)
+        assert scores == sorted(scores)
+        assert list(table["second_guesses"]) == [
+            word for word, _ in table["openers"][:2]
+        ]
+        assert json.loads(path.read_text()) == table
+        assert not (tmp_path / "openers.json.checkpoint").exists()
+
+    def test_resumes_from_checkpoint(self, tmp_path):
+        """Test that finished chunks are reused and a torn line is redone."""
+        path = str(tmp_path / "openers.json")
+        checkpoint = tmp_path / "run.checkpoint"
+        expected = rank_openers(
+            WORDS, table_path=path, processes=1, chunk_size=5, second_guess_top=1
+        )
+        header = {"fingerprint": _fingerprint(WORDS), "chunk_size": 5}
+        # Chunk 0 scores are deliberately wrong to show they are not redone.
+        fake = [[word, 0.0] for word in WORDS[:5]]
+        checkpoint.write_text(
+            json.dumps(header)
+            + "\n"
+            + json.dumps({"chunk": 0, "scores": fake})
+            + "\n"
+            + '{"chunk": 1, "sco'
+        )
+        table = rank_openers(
+            WORDS,
+            table_path=path,
+            checkpoint_path=str(checkpoint),
+            processes=1,
+            chunk_size=5,
+            second_guess_top=1,
+        )
+        assert sorted(table["openers"][:5]) == sorted(fake)
+        assert sorted(table["openers"][5:]) == sorted(
+            pair for pair in expected["openers"] if pair[0] not in WORDS[:5]
+        )
+
+    def test_ignores_stale_checkpoint(self, tmp_path):
+        """Test that a checkpoint for another word list is discarded."""
+        path = str(tmp_path / "openers.json")
+        checkpoint = tmp_path / "run.checkpoint"
+        header = {"fingerprint": "stale", "chunk_size": 5}
+        checkpoint.write_text(
+            json.dumps(header) + "\n" + json.dumps({"chunk": 0, "scores": []})
+        )
+        table = rank_openers(
+            WORDS,
+            table_path=path,
+            checkpoint_path=str(checkpoint),
+            processes=1,
+            chunk_size=5,
+            second_guess_top=1,
+        )
+        assert len(table["openers"]) == len(WORDS)
+
+    def test_ignores_torn_header(self, tmp_path):
+        """Test that a checkpoint whose header was cut short is discarded."""
+        path = str(tmp_path / "openers.json")
+        checkpoint = tmp_path / "run.checkpoint"
+        checkpoint.write_text('{"fingerprint": "ab')
+        table = rank_openers(
+            WORDS,
+            table_path=path,
+            checkpoint_path=str(checkpoint),
+            processes=1,
+            chunk_size=5,
+            second_guess_top=1,
+        )
+        assert len(table["openers"]) == len(WORDS)
+
+
+class TestLoadOpenerTable:
+    """Tests for load_opener_table and second_guess functions."""
+
+    def test_missing_table(self, tmp_path):
+        """Test that a table that was never built loads as None."""
+        assert load_opener_table(str(tmp_path / "missing.json")) is None
+
+    def test_second_guess_lookup(self, tmp_path):
+        """Test lookups by opener and packed feedback."""
+        path = str(tmp_path / "openers.json")
+        rank_openers(WORDS, table_path=path, processes=1, second_guess_top=1)
+        table = load_opener_table(path)
+        opener = table["openers"][0][0]
+        code = feedback_code(opener, "melon")
+        guess = second_guess(table, opener, code)
+        assert feedback_code(opener, guess) == code
+        assert second_guess(table, "zzzzz", code) is None
@@ -0,0 +1,160 @@
+"""Unit tests for shared_words module."""
+
+from multiprocessing import Pool, shared_memory
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+from src.game_logic import feedback_code, word_columns
+from src.shared_words import (
+    SharedWordTable,
+    _release,
+    build_pattern_matrix,
+    init_worker,
+    letter_mask,
+    worker_table,
+)
+
+WORDS = ["crane", "plane", "slate", "abbey", "react"]
+
+
+def _worker_lookup(row):
+    table = worker_table()
+    return table[row], table.pattern(row, 0)
+
+
+class TestLetterMask:
+    """Tests for letter_mask function."""
+
+    def test_letter_mask(self):
+        """Test that each distinct letter sets one bit."""
+        assert letter_mask("abba") == 0b11
+        assert letter_mask("crane") == letter_mask("nacre")
+
+
+class TestBuildPatternMatrix:
+    """Tests for build_pattern_matrix function."""
+
+    def test_matrix_matches_feedback_code(self):
+        """Test that each cell holds the feedback code of the pair."""
+        matrix = build_pattern_matrix(WORDS)
+        assert len(matrix) == len(WORDS) ** 2
+        for g, guess in enumerate(WORDS):
+            for s, solution in enumerate(WORDS):
+                cell = matrix[g * len(WORDS) + s]
+                assert cell == feedback_code(guess, solution)
+
+    def test_partial_rows(self):
+        """Test that rows limits the guesses to the leading words."""
+        assert len(build_pattern_matrix(WORDS, rows=2)) == 2 * len(WORDS)
+
+
+class TestSharedWordTable:
+    """Tests for SharedWordTable class."""
+
+    def test_round_trip(self):
+        """Test that words, indexes and patterns are readable back."""
+        patterns = build_pattern_matrix(WORDS, rows=2)
+        with SharedWordTable.create(WORDS, patterns) as table:
+            assert list(table) == WORDS
+            assert table[-1] == "react"
+            assert table.index("slate") == 2
+            assert table.index("zzzzz") is None
+            assert "abbey" in table
+            assert table.letter_mask(3) == letter_mask("abbey")
+            assert table.pattern_rows == 2
+            assert table.pattern(1, 0) == feedback_code("plane", "crane")
+            assert table.pattern_row(0) == bytes(patterns[:5])
+            assert table.columns() == word_columns(WORDS)
+
+    def test_attach_is_read_only_and_shares_data(self):
+        """Test that an attached table sees the owner's data read-only."""
+        with SharedWordTable.create(WORDS) as owner:
+            with SharedWordTable.attach(owner.name) as table:
+                assert list(table) == WORDS
+                assert table.owner is False
+                with pytest.raises(TypeError):
+                    table._words[0] = 0
+                with pytest.raises(PermissionError):
+                    table.unlink()
+
+    def test_attach_from_another_process_keeps_segment(self):
+        """Test that a separate process attaching and exiting leaves it."""
+        script = (
+            "from src.shared_words import SharedWordTable\n"
+            "with SharedWordTable.attach(%r) as table:\n"
+            "    print(table[0])\n"
+        )
+        with SharedWordTable.create(WORDS) as owner:
+            # Output is captured, so run() also waits for a resource tracker
+            # the child may have started, and for any cleanup it does.
+            result = subprocess.run(
+                [sys.executable, "-c", script % owner.name],
+                cwd=Path(__file__).resolve().parents[1],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            assert result.stdout == "crane\n"
+            assert "leaked" not in result.stderr
+            with SharedWordTable.attach(owner.name) as table:
+                assert list(table) == WORDS
+
+    def test_owner_close_removes_segment(self):
+        """Test that closing the owner removes the segment."""
+        table = SharedWordTable.create(WORDS)
+        name = table.name
+        table.close()
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+    def test_close_while_holding_pattern_row(self):
+        """Test that a row kept by the caller does not block close()."""
+        table = SharedWordTable.create(WORDS, build_pattern_matrix(WORDS, rows=1))
+        name = table.name
+        row = table.pattern_row(0)
+        table.close()
+        assert row[1] == feedback_code("crane", "plane")
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+    def test_release_unlinks_when_close_fails(self):
+        """Test that the owner still removes the segment if close() fails."""
+
+        class Segment:
+            unlinked = False
+
+            def close(self):
+                raise BufferError("cannot close exported pointers exist")
+
+            def unlink(self):
+                self.unlinked = True
+
+        segment = Segment()
+        with pytest.raises(BufferError):
+            _release(segment, True, [])
+        assert segment.unlinked
+
+    def test_rejects_mixed_lengths(self):
+        """Test that words of different lengths are rejected."""
+        with pytest.raises(ValueError):
+            SharedWordTable.create(["crane", "cat"])
+
+    def test_pool_workers_attach_by_name(self):
+        """Test that pool workers read the table through init_worker."""
+        patterns = build_pattern_matrix(WORDS)
+        with SharedWordTable.create(WORDS, patterns) as table:
+            with Pool(2, init_worker, (table.name,)) as pool:
+                results = pool.map(_worker_lookup, range(len(WORDS)))
+        assert results == [(w, feedback_code(w, "crane")) for w in WORDS]
+
+
+class TestWorkerTable:
+    """Tests for worker_table function."""
+
+    def test_requires_init_worker(self):
+        """Test that worker_table fails before init_worker runs."""
+        with pytest.raises(RuntimeError):
+            worker_table()
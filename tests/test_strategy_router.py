@@ -0,0 +1,139 @@
+"""Unit tests for strategy_router module."""
+
+import os
+from unittest.mock import patch
+
+from src.letter_stats import LetterStats
+from src.strategy_router import (
+    ANSWER_CACHE_SIZE,
+    ROUTE_CACHE,
+    ROUTE_FORCED,
+    ROUTE_LLM,
+    ROUTE_LOCAL,
+    RouterStats,
+    _answer_cache,
+    history_key,
+    load_routing_policy,
+    local_guess,
+    record_answer,
+    route_turn,
+)
+
+POLICY = {"local_threshold": 3, "use_cache": True, "llm_latency_estimate": 2.0}
+
+
+class TestLoadRoutingPolicy:
+    """Tests for load_routing_policy function."""
+
+    def test_defaults(self):
+        """Test the default policy."""
+        with patch.dict(os.environ, {}, clear=True):
+            policy = load_routing_policy()
+        assert policy == POLICY
+
+    def test_env_overrides(self):
+        """Test that environment variables override the defaults."""
+        env = {"ROUTER_LOCAL_THRESHOLD": "10", "ROUTER_USE_CACHE": "0"}
+        with patch.dict(os.environ, env):
+            policy = load_routing_policy()
+        assert policy["local_threshold"] == 10
+        assert policy["use_cache"] is False
+
+
+class TestRouteTurn:
+    """Tests for route_turn function."""
+
+    def setup_method(self):
+        _answer_cache.clear()
+
+    def test_single_candidate_is_forced(self):
+        """Test that a single remaining candidate is played directly."""
+        assert route_turn(["crane"], {}, POLICY) == (ROUTE_FORCED, "crane")
+
+    def test_below_threshold_is_local(self):
+        """Test that a small candidate set is answered locally."""
+        route, guess = route_turn(["crane", "crate"], {}, POLICY)
+        assert route == ROUTE_LOCAL
+        assert guess in ["crane", "crate"]
+
+    def test_large_set_goes_to_llm(self):
+        """Test that a large candidate set is routed to the model."""
+        candidates = ["crane", "crate", "trace", "slate"]
+        assert route_turn(candidates, {}, POLICY) == (ROUTE_LLM, None)
+
+    def test_cached_answer_is_reused(self):
+        """Test that a cached answer for the same history is reused."""
+        candidates = ["crane", "crate", "trace", "slate"]
+        history = {"stare": [0, 1, 2, 0, 2]}
+        record_answer(history, "trace")
+        assert route_turn(candidates, dict(history), POLICY) == (
+            ROUTE_CACHE,
+            "trace",
+        )
+
+    def test_cache_disabled(self):
+        """Test that cached answers are ignored when disabled."""
+        candidates = ["crane", "crate", "trace", "slate"]
+        history = {"stare": [0, 1, 2, 0, 2]}
+        record_answer(history, "trace")
+        policy = dict(POLICY, use_cache=False)
+        assert route_turn(candidates, history, policy) == (ROUTE_LLM, None)
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test that the cache stays bounded and keeps recently used answers."""
+        candidates = ["crane", "crate", "trace", "slate"]
+        oldest = {"stare": [0, 1, 2, 0, 2]}
+        record_answer(oldest, "trace")
+        record_answer({"guess": [0, 0, 0, 0, 0]}, "crane")
+        for i in range(ANSWER_CACHE_SIZE - 2):
+            record_answer({f"w{i}": [0, 0, 0, 0, 0]}, "crane")
+        # Using the oldest answer makes the other early entry the next to go.
+        assert route_turn(candidates, oldest, POLICY) == (ROUTE_CACHE, "trace")
+        record_answer({"extra": [0, 0, 0, 0, 0]}, "crane")
+        assert len(_answer_cache) == ANSWER_CACHE_SIZE
+        assert route_turn(candidates, oldest, POLICY) == (ROUTE_CACHE, "trace")
+        evicted = {"guess": [0, 0, 0, 0, 0]}
+        assert route_turn(candidates, evicted, POLICY) == (ROUTE_LLM, None)
+
+    def test_history_key_ignores_insertion_order(self):
+        """Test that the history key does not depend on guess order."""
+        first = {"crane": [0, 0, 0, 0, 0], "stare": [1, 0, 0, 0, 0]}
+        second = {"stare": [1, 0, 0, 0, 0], "crane": [0, 0, 0, 0, 0]}
+        assert history_key(first) == history_key(second)
+
+
+class TestLocalGuess:
+    """Tests for local_guess function."""
+
+    def test_prefers_splitting_letters(self):
+        """Test that the candidate with the best letter score is chosen."""
+        assert local_guess(["crane", "crate", "trace", "slate"]) == "crate"
+
+    def test_uses_given_stats(self):
+        """Test that passed statistics drive the choice."""
+        candidates = ["crane", "crate", "trace", "slate"]
+        stats = LetterStats(candidates)
+        with patch.object(stats, "scorer", return_value=len) as scorer:
+            assert local_guess(candidates, stats) == "crane"
+        scorer.assert_called_once()
+
+
+class TestRouterStats:
+    """Tests for RouterStats class."""
+
+    def test_latency_saved_uses_measured_latency(self):
+        """Test that saved latency uses the mean measured LLM latency."""
+        stats = RouterStats()
+        stats.record(ROUTE_LLM, 1.0)
+        stats.record(ROUTE_LLM, 3.0)
+        stats.record(ROUTE_LOCAL)
+        stats.record(ROUTE_FORCED)
+        assert stats.local_count() == 2
+        assert stats.latency_saved() == 4.0
+
+    def test_latency_saved_falls_back_to_estimate(self):
+        """Test that the estimate is used when no LLM call was timed."""
+        stats = RouterStats(llm_latency_estimate=1.5)
+        stats.record(ROUTE_CACHE)
+        assert stats.latency_saved() == 1.5
+        assert "llm=0" in stats.report()
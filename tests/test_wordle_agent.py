@@ -0,0 +1,112 @@
+"""Unit tests for wordle_agent module."""
+
+from unittest.mock import patch
+
+from src.game_hosts import AdversarialHost, FixedHost
+from src.llm_backends import BackendRateLimitError, StubBackend
+from src.openers import rank_openers
+from src.wordle_agent import extract_guess, llm_guess, wordle_agent
+
+CANDIDATES = ["plane", "slate"]
+
+
+class ScriptedBackend:
+    """Backend replaying a fixed list of answers or errors."""
+
+    def __init__(self, answers):
+        self.answers = list(answers)
+
+    def complete(self, messages):
+        answer = self.answers.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+
+class TestExtractGuess:
+    """Tests for extract_guess function."""
+
+    def test_formats(self):
+        """Test the supported answer formats."""
+        assert extract_guess("AGENT GUESS: Plane") == "plane"
+        assert extract_guess('```json\n{"guess": "slate"}\n```') == "slate"
+        assert extract_guess("no idea") is None
+
+
+class TestLlmGuess:
+    """Tests for llm_guess function."""
+
+    def test_valid_answer(self):
+        """Test that a valid answer is returned as a model guess."""
+        backend = ScriptedBackend(["AGENT GUESS: slate"])
+        assert llm_guess("crane", "", CANDIDATES, {}, backend) == ("slate", True)
+
+    def test_retries_invalid_answers(self):
+        """Test that invalid answers are retried."""
+        backend = ScriptedBackend(["AGENT GUESS: qqqqq", "", "guess: plane"])
+        assert llm_guess("crane", "", CANDIDATES, {}, backend) == ("plane", True)
+
+    def test_falls_back_after_five_invalid_answers(self):
+        """Test the random fallback after five invalid answers."""
+        backend = ScriptedBackend(["AGENT GUESS: qqqqq"] * 5)
+        guess, from_model = llm_guess("crane", "", CANDIDATES, {}, backend)
+        assert guess in CANDIDATES
+        assert from_model is False
+
+    def test_rate_limit_backoff(self):
+        """Test that rate limits back off without using up attempts."""
+        answers = [BackendRateLimitError(retry_after=None)] * 2
+        answers += ["AGENT GUESS: qqqqq"] * 4 + ["AGENT GUESS: slate"]
+        backend = ScriptedBackend(answers)
+        with patch("src.wordle_agent.time.sleep") as sleep:
+            result = llm_guess("crane", "", CANDIDATES, {}, backend)
+        assert result == ("slate", True)
+        assert [call[0][0] for call in sleep.call_args_list] == [0.5, 1.0]
+
+    def test_gives_up_after_repeated_rate_limits(self):
+        """Test the random fallback when the backend stays rate limited."""
+        backend = ScriptedBackend([BackendRateLimitError(retry_after=0)] * 6)
+        with patch("src.wordle_agent.time.sleep"):
+            guess, from_model = llm_guess("crane", "", CANDIDATES, {}, backend)
+        assert guess in CANDIDATES
+        assert from_model is False
+
+
+class TestWordleAgentOpeners:
+    """Tests for wordle_agent with a ranked opener table."""
+
+    def test_plays_table_opener_and_second_guess(self, tmp_path, capsys):
+        """Test the table's opener and second guess skip the model."""
+        words = ["crane", "plane", "slate", "abbey", "react", "lemon", "light"]
+        table = rank_openers(
+            words, table_path=str(tmp_path / "openers.json"), processes=1
+        )
+        opener = table["openers"][0][0]
+        solution = next(word for word in words if word != opener)
+        with patch("src.wordle_agent.retrieve_word_list", return_value=words), patch(
+            "src.wordle_agent.load_opener_table", return_value=table
+        ), patch("src.wordle_agent.make_host", return_value=FixedHost(solution)):
+            wordle_agent(backend=ScriptedBackend([]))
+        output = capsys.readouterr().out
+        assert f"GUESS:  {opener}" in output
+        assert "llm=0" in output
+
+
+class TestWordleAgentHost:
+    """Tests for wordle_agent with a host instance."""
+
+    def test_reuses_host_across_games(self, capsys):
+        """Test that a given host is reset and reused instead of rebuilt."""
+        words = ["crane", "plane", "slate", "abbey", "react", "lemon", "light"]
+        host = AdversarialHost(words)
+        with patch("src.wordle_agent.load_opener_table", return_value=None), patch(
+            "src.wordle_agent.random.choice", return_value="crane"
+        ), patch("src.wordle_agent.make_host") as make_host, patch.object(
+            host, "new_game", wraps=host.new_game
+        ) as new_game:
+            for _ in range(2):
+                wordle_agent(host=host, backend=StubBackend(), words=words)
+        make_host.assert_not_called()
+        assert new_game.call_count == 2
+        assert list(host._opening) == ["crane"]
+        assert "SOLUTION:  (adversarial)" in capsys.readouterr().out